@@ -1,94 +1,241 @@
 import os
+import io
+import re
+import time
+import pickle
+import hashlib
+import tempfile
 import argparse
-from jira import JIRA
-import git
-from datetime import datetime
-from dotenv import load_dotenv
-
-# Import the new report visualizer
+import subprocess
+from collections import Counter, defaultdict, namedtuple
+from functools import lru_cache
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+# libgit2 bindings are optional; they walk history without spawning git subprocesses
 try:
-    from report_visualizer import ReportVisualizer
-    VISUALIZER_AVAILABLE = True
-    print("✅ Report Visualizer loaded successfully")
-except ImportError as e:
-    VISUALIZER_AVAILABLE = False
-    print(f"⚠️ Report Visualizer not available: {e}")
-    print("   Install dependencies: pip install -r requirements.txt")
+    import pygit2
+    PYGIT2_AVAILABLE = True
+except ImportError:
+    PYGIT2_AVAILABLE = False
 
 # Constants
 NO_TASKS_COMPLETED_MESSAGE = "No tasks completed during this period."
-
-# Load environment variables from .env file
-load_dotenv()
-
-# Check for required environment variables
-required_vars = ["JIRA_URL", "JIRA_USERNAME", "JIRA_API_TOKEN"]
-missing_vars = [var for var in required_vars if not os.getenv(var)]
-if missing_vars:
-    print(f"Error: Missing environment variables: {', '.join(missing_vars)}")
-    exit(1)
-
-# Initialize AI clients (optional - will fallback if not available)
+DONE_STATUSES = frozenset(['done', 'closed', 'resolved'])  # Jira statuses that count as delivered work
+HIGH_PRIORITIES = frozenset(['high', 'highest'])  # Priorities counted as high-priority work in the business metrics
+ACTION_WORDS = frozenset(['add', 'create', 'implement', 'build', 'develop', 'fix', 'update', 'improve', 'enhance', 'optimize'])  # Verbs that start an action phrase in a title
+NEW_WORK_KEYWORDS = ('add', 'create', 'implement', 'new')  # Title substrings counted as new feature work
+JIRA_PAGE_SIZE = 500  # Issues requested per search page; servers may cap it lower, and the first page reports the cap
+JIRA_FETCH_WORKERS = 8  # Concurrent page requests when a search spans several pages
+JIRA_HTTP_POOL_SIZE = 16  # Kept-alive connections per host, enough for every page worker
+JIRA_KEY_BATCH_SIZE = 1000  # Issue keys per `key in (...)` search
+
+# Request only the fields the task builder reads; Jira serializes every requested field per issue
+TASK_FIELDS = [
+    'summary', 'issuetype', 'priority', 'status', 'assignee',
+    'timeoriginalestimate', 'timespent', 'aggregatetimespent',
+    'created', 'updated', 'resolutiondate'
+]  # The sprint field is added per server, see discover_sprint_fields
+SPRINT_FIELD_CANDIDATES = ('sprint', 'customfield_10020')  # Used when the field list cannot be read
+SPRINT_FIELD_SCHEMA = 'com.pyxis.greenhopper.jira:gh-sprint'  # Custom field type of Jira Software sprints
+SPRINT_STATE_RE = re.compile(r'state=(CLOSED|COMPLETE|ACTIVE|OPEN)')  # State in legacy "Sprint@...[state=...]" strings
+TASK_ID_RE = re.compile(r'\b([A-Z][A-Z0-9_]*-\d+)\b')  # Jira issue keys such as PROJ-123
+TASK_ID_BYTES_RE = re.compile(TASK_ID_RE.pattern.encode('ascii'))  # Same keys, matched in undecoded commit messages
+GIT_LOG_READ_SIZE = 1 << 16  # Bytes read from the `git log` pipe at a time
+GIT_INDEX_WORKERS = 4  # Repositories indexed concurrently; git log subprocess walks overlap, pygit2 walks mostly serialise on the GIL
+OPENAI_SUMMARY_MODEL = "gpt-4o-mini"  # Fast, inexpensive chat model for the stakeholder summary
+MONTH_NAMES = ('', 'January', 'February', 'March', 'April', 'May', 'June', 'July',
+               'August', 'September', 'October', 'November', 'December')  # Indexed by month number for report periods
+
+# Title classifiers: each alternation matches if any keyword occurs as a substring,
+# replacing a Python-level `any(keyword in text ...)` loop with one regex scan
+HIGH_COMPLEXITY_RE = re.compile('integration|migration|refactor|architecture|security|performance|optimization|algorithm|complex|system')
+MEDIUM_COMPLEXITY_RE = re.compile('feature|implementation|enhancement|workflow|process|validation|authentication|database|api')
+SIMPLE_TASK_RE = re.compile('fix|update|minor|text|styling|copy|simple')
+FEATURE_WORK_RE = re.compile('feature|add|new|implement|create')
+IMPROVEMENT_WORK_RE = re.compile('fix|improve|update|enhance|optimize')
+SECURITY_WORK_RE = re.compile('security|auth|token|validation|access')
+PLANNING_WORK_RE = re.compile('research|analysis|planning|design|spec')
+WORK_TYPE_PATTERNS = (('feature', FEATURE_WORK_RE), ('improvement', IMPROVEMENT_WORK_RE), ('security', SECURITY_WORK_RE))  # Checked in order; a title counts once
+TASK_HEURISTIC_CACHE_SIZE = 512  # Memoized (title, type, priority) heuristics; types and priorities repeat constantly
+BUSINESS_VALUE_CACHE_SIZE = 4096  # Memoized (title, category) business value statements
+
+# Business value phrasing rules per category impact: (terms matched against the title and its
+# action phrases, context used when no action phrase matches, statement template); first match wins
+BUSINESS_VALUE_RULES = {
+    "Revenue & Sales": (
+        (re.compile('discount|coupon|promo'), 'promotional system',
+         "Enhanced promotional capabilities through {}, driving sales conversion and customer acquisition"),
+        (re.compile('cart'), 'shopping cart functionality',
+         "Improved shopping experience via {}, reducing cart abandonment and increasing completion rates"),
+        (re.compile('payment|billing|checkout'), 'payment processing',
+         "Streamlined {} for better user experience and increased transaction success rates"),
+    ),
+    "User Experience": (
+        (re.compile('login|auth|session'), 'authentication system',
+         "Enhanced user access through {}, improving security and user experience"),
+        (re.compile('ui|interface|design|theme'), 'user interface',
+         "Improved {} for better user engagement and platform usability"),
+        (re.compile('template|layout'), 'template system',
+         "Expanded design capabilities through {}, providing more user customization options"),
+    ),
+    "Security & Compliance": (
+        (re.compile('token|jwt|auth'), 'authentication security',
+         "Strengthened {} infrastructure, improving access controls and data protection"),
+        (re.compile('validation|verify'), 'validation system',
+         "Enhanced {} for improved data integrity and security compliance"),
+        (re.compile('cookie|session|privacy'), 'privacy controls',
+         "Improved {} for better data handling and regulatory compliance"),
+    ),
+    "Operational Efficiency": (
+        (re.compile('admin'), 'administrative functionality',
+         "Enhanced {} for improved workflow efficiency and system management"),
+        (re.compile('filter|search|crud'), 'data management tools',
+         "Improved {} for enhanced operational productivity and data access"),
+        (re.compile('automation|cron|batch'), 'automated processes',
+         "Implemented {} to reduce manual overhead and increase operational efficiency"),
+    ),
+    "Platform Stability": (
+        (re.compile('bug|fix|error'), 'system issues',
+         "Resolved {} to improve platform reliability and user experience"),
+        (re.compile('performance|optimize|speed'), 'system performance',
+         "Optimized {} for improved responsiveness and user satisfaction"),
+        (re.compile('storage|database|cache'), 'data infrastructure',
+         "Enhanced {} for better system stability and data management"),
+    ),
+    "Feature Expansion": (
+        (re.compile('new|add|create'), 'platform capabilities',
+         "Expanded {} to provide additional user value and functionality"),
+        (re.compile('implement|develop|build'), 'new functionality',
+         "Delivered {} to enhance platform offerings and user experience"),
+    ),
+}
+
+# On-disk caches for expensive results that repeat across runs
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'freelancepay')
+SUMMARY_CACHE_DIR = os.path.join(CACHE_DIR, 'summaries')
+SUMMARY_CACHE_MAX_ENTRIES = 10
+SUMMARY_CACHE_TTL_SECONDS = 7 * 24 * 3600  # Drop summaries that have not been used for a week
+COMMIT_CACHE_DIR = os.path.join(CACHE_DIR, 'commits')
+COMMIT_CACHE_MAX_ENTRIES = 20
+COMMIT_CACHE_VERSION = 2  # Bump when CommitRecord changes so stale pickles are never loaded
+GEMINI_MODEL_CACHE_PATH = os.path.join(CACHE_DIR, 'gemini_model.txt')  # Model found by list_models discovery
+
+# Lightweight, picklable commit view shared by every walker; the author time stays a raw
+# epoch (plus the author's UTC offset in minutes) and is only formatted when reported
+CommitRecord = namedtuple('CommitRecord', ['hexsha', 'message', 'authored_date', 'author_offset'])
+
+# AI clients, set up on first use by initialize_ai_clients() (optional - will fallback if not available)
 openai_client = None
 gemini_model = None
+ai_clients_initialized = False
+ai_summary_memo = {}  # prompt -> AI summary (or None when no AI answered) for this run
 
-# Try to initialize OpenAI
-if os.getenv("OPENAI_API_KEY"):
+@lru_cache(maxsize=None)
+def load_report_visualizer():
+    """Import the report visualizer on first use; its pandas/plotly/docx stack is slow to load."""
     try:
-        from openai import OpenAI
-        openai_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        print("✅ OpenAI client initialized")
-    except ImportError:
-        print("⚠️ OpenAI package not installed")
-
-# Try to initialize Gemini
-if os.getenv("GEMINI_API_KEY"):
+        from report_visualizer import ReportVisualizer
+        print("✅ Report Visualizer loaded successfully")
+        return ReportVisualizer
+    except ImportError as e:
+        print(f"⚠️ Report Visualizer not available: {e}")
+        print("   Install dependencies: pip install -r requirements.txt")
+        return None
+
+def initialize_ai_clients():
+    """Initialize the optional AI clients once, importing their SDKs only when a key is configured."""
+    global openai_client, gemini_model, ai_clients_initialized
+    if ai_clients_initialized:
+        return
+    ai_clients_initialized = True
+    
+    # Try to initialize OpenAI
+    if os.getenv("OPENAI_API_KEY"):
+        try:
+            from openai import OpenAI
+            openai_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+            print("✅ OpenAI client initialized")
+        except ImportError:
+            print("⚠️ OpenAI package not installed")
+
+    # Try to initialize Gemini
+    if os.getenv("GEMINI_API_KEY"):
+        try:
+            import google.generativeai as genai
+            genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
+            gemini_model = create_gemini_model(genai)
+        except ImportError:
+            print("⚠️ Google AI package not installed")
+
+def load_cached_gemini_model_name():
+    """Load the Gemini model name found by a previous run's discovery, or None."""
     try:
-        import google.generativeai as genai
-        genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
-        # Try the newer model names first
+        with open(GEMINI_MODEL_CACHE_PATH, encoding='utf-8') as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+def store_cached_gemini_model_name(model_name):
+    """Remember the discovered Gemini model name so later runs skip list_models."""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(GEMINI_MODEL_CACHE_PATH, 'w', encoding='utf-8') as f:
+            f.write(model_name)
+    except OSError as e:
+        print(f"⚠️ Could not cache Gemini model name: {e}")
+
+def create_gemini_model(genai):
+    """Create the Gemini model, preferring a configured or previously discovered model name."""
+    # FREELANCEPAY_GEMINI_MODEL pins the model; otherwise reuse the last discovery result
+    preferred_model = os.getenv("FREELANCEPAY_GEMINI_MODEL") or load_cached_gemini_model_name()
+    
+    # Try the newer model names first
+    model_names = ['gemini-1.5-flash', 'gemini-1.5-pro']
+    if preferred_model:
+        model_names.insert(0, preferred_model)
+    
+    for model_name in model_names:
         try:
-            gemini_model = genai.GenerativeModel('gemini-1.5-flash')
-            print("✅ Gemini client initialized (using gemini-1.5-flash)")
+            model = genai.GenerativeModel(model_name)
+            print(f"✅ Gemini client initialized (using {model_name})")
+            return model
         except Exception:
-            try:
-                gemini_model = genai.GenerativeModel('gemini-1.5-pro')
-                print("✅ Gemini client initialized (using gemini-1.5-pro)")
-            except Exception:
-                # Fallback to listing available models
-                try:
-                    models = list(genai.list_models())
-                    available_models = [model.name for model in models if 'generateContent' in model.supported_generation_methods]
-                    if available_models:
-                        # Use the first available model
-                        model_name = available_models[0].replace('models/', '')
-                        gemini_model = genai.GenerativeModel(model_name)
-                        print(f"✅ Gemini client initialized (using {model_name})")
-                    else:
-                        print("⚠️ No compatible Gemini models found")
-                        gemini_model = None
-                except Exception as e:
-                    print(f"⚠️ Could not initialize Gemini: {e}")
-                    gemini_model = None
-    except ImportError:
-        print("⚠️ Google AI package not installed")
+            continue
+    
+    # Fallback to listing available models (a network round-trip, so the result is cached)
+    try:
+        models = list(genai.list_models())
+        available_models = [model.name for model in models if 'generateContent' in model.supported_generation_methods]
+        if available_models:
+            # Use the first available model
+            model_name = available_models[0].replace('models/', '')
+            model = genai.GenerativeModel(model_name)
+            store_cached_gemini_model_name(model_name)
+            print(f"✅ Gemini client initialized (using {model_name})")
+            return model
+        print("⚠️ No compatible Gemini models found")
+    except Exception as e:
+        print(f"⚠️ Could not initialize Gemini: {e}")
+    return None
 
 def parse_assignee_info(current_assignee, target_assignee):
-    """Parse and validate assignee information."""
+    """Parse and validate assignee information from the raw assignee dict."""
     if not current_assignee:
         return False
     
-    assignee_email = getattr(current_assignee, 'emailAddress', '')
-    assignee_name = getattr(current_assignee, 'name', '')
-    assignee_display = getattr(current_assignee, 'displayName', '')
+    assignee_email = current_assignee.get('emailAddress', '')
+    assignee_name = current_assignee.get('name', '')
+    assignee_display = current_assignee.get('displayName', '')
     
     return target_assignee in [assignee_email, assignee_name, assignee_display]
 
-def extract_time_fields(issue):
-    """Extract time tracking information from JIRA issue."""
-    time_spent_seconds = getattr(issue.fields, 'timespent', None) or 0
-    time_estimate_seconds = getattr(issue.fields, 'timeoriginalestimate', None) or 0
-    aggregate_time_seconds = getattr(issue.fields, 'aggregatetimespent', None) or 0
+def extract_time_fields(fields):
+    """Extract time tracking information from a JIRA issue's raw fields."""
+    time_spent_seconds = fields.get('timespent') or 0
+    time_estimate_seconds = fields.get('timeoriginalestimate') or 0
+    aggregate_time_seconds = fields.get('aggregatetimespent') or 0
     
     return {
         'jira_time_spent': time_spent_seconds / 3600 if time_spent_seconds else 0,
@@ -96,21 +243,19 @@ def extract_time_fields(issue):
         'jira_aggregate_time': aggregate_time_seconds / 3600 if aggregate_time_seconds else 0
     }
 
-def detect_sprint_info(issue):
+def detect_sprint_info(fields, sprint_fields=SPRINT_FIELD_CANDIDATES):
     """Detect sprint information from various JIRA field formats."""
-    sprint_field_candidates = ['sprint', 'customfield_10020', 'customfield_10010', 'customfield_10001']
-    
-    for field_name in sprint_field_candidates:
-        sprint_info, sprint_status = try_extract_sprint_from_field(issue, field_name)
+    for field_name in sprint_fields:
+        sprint_info, sprint_status = try_extract_sprint_from_field(fields, field_name)
         if sprint_info:
             return sprint_info, sprint_status
     
     return None, "Unknown"
 
-def try_extract_sprint_from_field(issue, field_name):
+def try_extract_sprint_from_field(fields, field_name):
     """Try to extract sprint information from a specific field."""
     try:
-        sprint_field = getattr(issue.fields, field_name, None)
+        sprint_field = fields.get(field_name)
         if not sprint_field:
             return None, "Unknown"
         
@@ -118,7 +263,7 @@ def try_extract_sprint_from_field(issue, field_name):
             return parse_sprint_object(sprint_field[-1])
         elif isinstance(sprint_field, str) and sprint_field:
             return sprint_field, "Active"
-        elif hasattr(sprint_field, 'name'):
+        elif isinstance(sprint_field, dict) and 'name' in sprint_field:
             return parse_sprint_object(sprint_field)
     except (AttributeError, TypeError):
         pass
@@ -126,15 +271,17 @@ def try_extract_sprint_from_field(issue, field_name):
     return None, "Unknown"
 
 def parse_sprint_object(sprint_obj):
-    """Parse a sprint object to extract name and status."""
-    sprint_info = str(sprint_obj)
+    """Parse a sprint (a raw dict, or a legacy string) to extract name and status."""
+    if not isinstance(sprint_obj, dict):
+        sprint_info = str(sprint_obj)
+        return sprint_info, parse_sprint_state_from_string(sprint_info)
     
-    if hasattr(sprint_obj, 'name'):
-        sprint_info = getattr(sprint_obj, 'name', 'Unknown')
+    # Only stringify the whole sprint when it has no name
+    sprint_info = sprint_obj['name'] if 'name' in sprint_obj else str(sprint_obj)
     
-    if hasattr(sprint_obj, 'state'):
-        state = getattr(sprint_obj, 'state', 'UNKNOWN')
-        sprint_status = map_sprint_state(state)
+    if 'state' in sprint_obj:
+        # Jira Cloud reports states in lowercase ("closed"), Server in uppercase
+        sprint_status = map_sprint_state(str(sprint_obj['state']).upper())
     else:
         sprint_status = parse_sprint_state_from_string(sprint_info)
     
@@ -151,45 +298,159 @@ def map_sprint_state(state):
 
 def parse_sprint_state_from_string(sprint_info):
     """Parse sprint status from string representation."""
-    if 'state=CLOSED' in sprint_info or 'state=COMPLETE' in sprint_info:
-        return "Closed"
-    elif 'state=ACTIVE' in sprint_info or 'state=OPEN' in sprint_info:
-        return "Active"
-    else:
-        return "Future"
-
-def is_task_in_date_range(issue, start_date, end_date):
-    """Check if task falls within the specified date range."""
-    created_date = getattr(issue.fields, 'created', None)
-    updated_date = getattr(issue.fields, 'updated', None)
-    resolved_date = getattr(issue.fields, 'resolved', None)
+    state_match = SPRINT_STATE_RE.search(sprint_info)
+    return map_sprint_state(state_match.group(1)) if state_match else "Future"
+
+def is_task_in_date_range(fields, start_day, end_day, updated_prefiltered=False):
+    """Check if task falls within the specified date range (given as parsed dates)."""
+    updated_date = fields.get('updated')
+    # The basic JQL already bounds 'updated' to the range, so there is nothing to re-check
+    if updated_prefiltered and updated_date:
+        return True
     
-    for date_field in [created_date, updated_date, resolved_date]:
-        if date_field and check_date_in_range(date_field, start_date, end_date):
+    created_date = fields.get('created')
+    resolved_date = fields.get('resolutiondate')
+    
+    # 'updated' is the field most likely to match, so try it first
+    for date_field in [updated_date, created_date, resolved_date]:
+        if date_field and check_date_in_range(date_field, start_day, end_day):
             return True
     
     # If we can't determine dates, include the task
-    if not any([created_date, updated_date, resolved_date]):
+    if not (created_date or updated_date or resolved_date):
         return True
     
     return False
 
-def check_date_in_range(date_field, start_date, end_date):
+@lru_cache(maxsize=4096)
+def parse_jira_date(timestamp):
+    """Parse a Jira timestamp string to its calendar date; fields often repeat the same value."""
+    return datetime.fromisoformat(timestamp.replace('Z', '+00:00')).date()
+
+def check_date_in_range(date_field, start_day, end_day):
     """Check if a specific date falls within the range."""
     try:
         if isinstance(date_field, str):
-            date_obj = datetime.fromisoformat(date_field.replace('Z', '+00:00'))
+            task_date = parse_jira_date(date_field)
         else:
-            date_obj = date_field
+            task_date = date_field.date()
         
-        task_date = date_obj.date()
-        start_dt = datetime.strptime(start_date, '%Y-%m-%d').date()
-        end_dt = datetime.strptime(end_date, '%Y-%m-%d').date()
-        
-        return start_dt <= task_date <= end_dt
+        return start_day <= task_date <= end_day
     except (ValueError, AttributeError):
         return False
 
+def create_jira_client():
+    """Create the Jira client with a connection pool large enough for concurrent page fetches."""
+    from jira import JIRA
+    from requests.adapters import HTTPAdapter
+    
+    jira = JIRA(server=os.getenv("JIRA_URL"), basic_auth=(os.getenv("JIRA_USERNAME"), os.getenv("JIRA_API_TOKEN")))
+    
+    # The default pool keeps too few connections for the page workers, so the
+    # surplus ones would be reopened (with a fresh TLS handshake) on every request
+    adapter = HTTPAdapter(pool_connections=JIRA_HTTP_POOL_SIZE, pool_maxsize=JIRA_HTTP_POOL_SIZE)
+    jira._session.mount('https://', adapter)
+    jira._session.mount('http://', adapter)
+    return jira
+
+def iter_search_pages(jira, jql, fields, page_size=JIRA_PAGE_SIZE, use_post=False, validate_query=True):
+    """Yield the result pages of a JQL query in order, while later pages are still being fetched."""
+    # Jira Cloud only supports token-based paging, which the client handles itself
+    if getattr(jira, '_is_cloud', False):
+        yield jira.search_issues(jql, fields=fields, maxResults=False, validate_query=validate_query, use_post=use_post)
+        return
+
+    # The first page doubles as the probe: it carries the total and the page size the server allowed
+    first_page = jira.search_issues(jql, startAt=0, maxResults=page_size, validate_query=validate_query, fields=fields, use_post=use_post)
+    total = first_page.total or 0
+    if len(first_page) >= total:
+        yield first_page
+        return
+
+    # Step by the server's effective cap (often 100) so no offsets are skipped
+    step = min(first_page.maxResults or len(first_page), page_size) or page_size
+
+    def fetch_page(start_at):
+        return jira.search_issues(jql, startAt=start_at, maxResults=step, validate_query=validate_query, fields=fields, use_post=use_post)
+
+    with ThreadPoolExecutor(max_workers=JIRA_FETCH_WORKERS) as executor:
+        pages = executor.map(fetch_page, range(len(first_page), total, step))
+        yield first_page
+        yield from pages
+
+def search_all_issues(jira, jql, fields, page_size=JIRA_PAGE_SIZE, use_post=False, validate_query=True):
+    """Fetch every issue matching a JQL query, requesting the result pages concurrently."""
+    return [issue for page in iter_search_pages(jira, jql, fields, page_size, use_post, validate_query) for issue in page]
+
+def build_task(issue_key, fields, assignee, sprint_fields=SPRINT_FIELD_CANDIDATES):
+    """Build the task dictionary used throughout the report from a Jira issue's raw fields."""
+    # Extract time information
+    time_info = extract_time_fields(fields)
+    
+    # Detect sprint information
+    sprint_info, sprint_status = detect_sprint_info(fields, sprint_fields)
+    
+    # Get task status and dates
+    task_status = fields.get('status')
+    task_status_name = task_status.get('name', 'Unknown') if task_status else 'Unknown'
+    priority = fields.get('priority')
+    title = fields['summary']
+    task_type = fields['issuetype']['name']
+    priority_name = priority['name'] if priority else 'Medium'
+    
+    return {
+        'id': issue_key,
+        'title': title,
+        'type': task_type,
+        'priority': priority_name,
+        # Lowercased once here for the keyword matching done throughout the report
+        'title_lower': title.lower(),
+        'type_lower': task_type.lower(),
+        'priority_lower': priority_name.lower(),
+        'status': task_status_name,
+        'status_lower': task_status_name.lower(),
+        'sprint_info': sprint_info,
+        'sprint_status': sprint_status,
+        'created_date': fields.get('created'),
+        'updated_date': fields.get('updated'),
+        'resolved_date': fields.get('resolutiondate'),
+        'assignee_email': assignee,
+        **time_info
+    }
+
+def process_issue(issue, assignee, start_day, end_day, updated_prefiltered=False, sprint_fields=SPRINT_FIELD_CANDIDATES):
+    """Build the task for an issue, or return None if it is not the assignee's work in the date range."""
+    # Read the plain JSON dict; Resource attribute access goes through __getattr__ fallbacks
+    fields = issue.raw['fields']
+    
+    # Verify assignee
+    if not parse_assignee_info(fields.get('assignee'), assignee):
+        return None
+    
+    # Filter by date range
+    if not is_task_in_date_range(fields, start_day, end_day, updated_prefiltered):
+        return None
+    
+    return build_task(issue.key, fields, assignee, sprint_fields)
+
+def discover_sprint_fields(jira):
+    """Find the ids of the server's sprint custom fields, so only those are requested."""
+    try:
+        sprint_fields = tuple(
+            field['id'] for field in jira.fields()
+            if field.get('schema', {}).get('custom') == SPRINT_FIELD_SCHEMA
+        )
+    except Exception as e:
+        print(f"⚠️ Could not read the Jira field list: {e}")
+        return SPRINT_FIELD_CANDIDATES
+    
+    return sprint_fields or SPRINT_FIELD_CANDIDATES
+
+def print_sprint_distribution(tasks):
+    """Print how many tasks fall in each sprint status."""
+    sprint_summary = Counter(task['sprint_status'] for task in tasks)
+    print(f"📈 Sprint distribution: {dict(sprint_summary)}")
+
 def fetch_tasks(jira, assignee, start_date, end_date):
     """Fetch tasks from Jira assigned to the user within the date range, focusing on actual work done."""
     
@@ -198,108 +459,306 @@ def fetch_tasks(jira, assignee, start_date, end_date):
     # Start with a simpler, more compatible query
     basic_jql = f'assignee = "{assignee}" AND updated >= "{start_date}" AND updated <= "{end_date}"'
     
-    # Include time tracking fields and sprint information
-    fields = [
-        'summary', 'issuetype', 'priority', 'status', 'assignee',
-        'timeoriginalestimate', 'timespent', 'aggregatetimespent', 'timeestimate',
-        'created', 'updated', 'resolved', 'resolutiondate',
-        'customfield_10020', 'sprint', 'fixVersions', 'labels'
-    ]
+    # Parse the report boundaries once rather than for every issue and date field
+    start_day = datetime.strptime(start_date, '%Y-%m-%d').date()
+    end_day = datetime.strptime(end_date, '%Y-%m-%d').date()
+    
+    sprint_fields = discover_sprint_fields(jira)
     
     try:
-        issues = jira.search_issues(basic_jql, fields=fields, maxResults=100)
-        print(f"✅ Found {len(issues)} tasks using basic query")
+        # Process each page as soon as it arrives, overlapping the Python work with the remaining downloads
+        tasks = []
+        issue_count = 0
+        for page in iter_search_pages(jira, basic_jql, TASK_FIELDS + list(sprint_fields), use_post=True):
+            issue_count += len(page)
+            for issue in page:
+                task = process_issue(issue, assignee, start_day, end_day, True, sprint_fields)
+                if task:
+                    tasks.append(task)
+        print(f"✅ Found {issue_count} tasks using basic query")
     except Exception as e:
         print(f"⚠️ Query failed: {e}")
         # Even more basic fallback
         minimal_jql = f'assignee = "{assignee}"'
         issues = jira.search_issues(minimal_jql, fields=['summary', 'issuetype', 'priority'], maxResults=50)
         print(f"✅ Found {len(issues)} tasks using minimal query")
+        tasks = [task for task in (process_issue(issue, assignee, start_day, end_day) for issue in issues) if task]
+    
+    print(f"📊 Found {len(tasks)} relevant tasks for {assignee}")
+    
+    # Group by sprint status for reporting
+    print_sprint_distribution(tasks)
+    
+    return tasks
+
+def fetch_tasks_by_keys(jira, issue_keys, assignee):
+    """Fetch specific Jira issues in bulk with `key in (...)` searches instead of one request per issue."""
+    from jira.exceptions import JIRAError
+    
+    print(f"🔍 Fetching {len(issue_keys)} requested tasks...")
+    
+    # Only well-formed keys are quoted into the JQL; anything else would break the whole batch
+    valid_keys = [key.upper() for key in issue_keys if TASK_ID_RE.fullmatch(key.upper())]
+    invalid_keys = [key for key in issue_keys if not TASK_ID_RE.fullmatch(key.upper())]
+    if invalid_keys:
+        print(f"⚠️ Skipping malformed issue keys: {', '.join(invalid_keys)}")
+    
+    sprint_fields = discover_sprint_fields(jira)
+    fields = TASK_FIELDS + list(sprint_fields)
     
     tasks = []
-    for issue in issues:
-        # Verify assignee
-        if not parse_assignee_info(getattr(issue.fields, 'assignee', None), assignee):
+    for i in range(0, len(valid_keys), JIRA_KEY_BATCH_SIZE):
+        batch = valid_keys[i:i + JIRA_KEY_BATCH_SIZE]
+        keys_jql = ', '.join(f'"{key}"' for key in batch)
+        # POST keeps long key lists out of the URL; 'warn' lets unknown keys drop out instead of failing the search
+        try:
+            issues = search_all_issues(jira, f'key in ({keys_jql})', fields, use_post=True, validate_query='warn')
+        except JIRAError as e:
+            print(f"⚠️ Could not fetch {', '.join(batch)}: {e.text or e}")
             continue
+        tasks.extend(build_task(issue.key, issue.raw['fields'], assignee, sprint_fields) for issue in issues)
+    
+    print(f"📊 Found {len(tasks)} of {len(issue_keys)} requested tasks")
+    print_sprint_distribution(tasks)
+    
+    return tasks
+
+@lru_cache(maxsize=None)
+def try_open_repository(repo_path):
+    """Open a repository once per path, returning (repo, None) or (None, error); both outcomes are cached."""
+    try:
+        if PYGIT2_AVAILABLE:
+            return pygit2.Repository(repo_path), None
         
-        # Extract time information
-        time_info = extract_time_fields(issue)
+        import git
+        return git.Repo(repo_path, odbt=git.GitCmdObjectDB), None
+    except Exception as e:
+        return None, e
+
+def open_repository(repo_path):
+    """Get the shared repository object for a path, as pygit2 when available."""
+    repo, error = try_open_repository(repo_path)
+    if error:
+        raise error  # An invalid path fails fast without probing the filesystem again
+    return repo
+
+def get_commit_time_window(start_date, end_date):
+    """Convert the report dates to epoch bounds covering the whole start and end days (local time)."""
+    start_ts = int(datetime.strptime(start_date, '%Y-%m-%d').timestamp())
+    end_ts = int((datetime.strptime(end_date, '%Y-%m-%d') + timedelta(days=1)).timestamp())
+    return start_ts, end_ts  # end_ts is exclusive
+
+def get_head_sha(repo):
+    """Get the commit SHA that HEAD points to."""
+    if PYGIT2_AVAILABLE:
+        return str(repo.head.target)
+    return repo.head.commit.hexsha
+
+def is_ancestor_commit(repo, ancestor_sha, head_sha):
+    """Check whether a previously indexed HEAD is still part of the current history."""
+    try:
+        if PYGIT2_AVAILABLE:
+            return ancestor_sha == head_sha or repo.descendant_of(head_sha, ancestor_sha)
+        return repo.is_ancestor(ancestor_sha, head_sha)
+    except Exception:
+        return False  # The old HEAD was rewritten away or garbage collected
+
+def iter_git_log(repo_path, log_args):
+    """Stream the raw records of a `git log` whose format ends each commit with %x1e."""
+    command = ['git', '-C', repo_path, 'log', *log_args]
+    with subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE) as process:
+        pending = b''
+        for chunk in iter(lambda: process.stdout.read(GIT_LOG_READ_SIZE), b''):
+            *records, pending = (pending + chunk).split(b'\x1e')
+            for record in records:
+                yield record.lstrip(b'\n')  # git separates records with a newline
+        error_output = process.stderr.read()
+    
+    if process.returncode:
+        raise RuntimeError(f"git log failed in {repo_path}: {error_output.decode('utf-8', 'replace').strip()}")
+
+def build_commit_index(repo_path, start_ts, end_ts, author=None, head_sha='HEAD', since_head=None, project_prefix=None):
+    """Walk the repository history once with a single `git log` stream and index commits by task ID."""
+    rev = f'{since_head}..{head_sha}' if since_head else head_sha
+    # git reads '@<epoch>' as an exact instant, whereas a bare date would get the current time of day
+    log_args = [rev, '--since', f'@{start_ts}', '--until', f'@{end_ts - 1}',
+                '--date=format:%z', '--format=%H%x1f%at%x1f%ad%x1f%B%x1e']
+    if author:
+        log_args += ['--author', author]  # Let git drop other authors' commits during the walk itself
+    if project_prefix:
+        # git filters the messages itself, so a huge history never reaches Python
+        log_args += ['-E', '--grep', f'{re.escape(project_prefix)}-[0-9]+']
+    log_args.append('--')  # Never read the revision as a file path
+    
+    commit_index = {}
+    for record in iter_git_log(repo_path, log_args):
+        if not record:
+            continue
         
-        # Detect sprint information
-        sprint_info, sprint_status = detect_sprint_info(issue)
+        hexsha, authored_date, tz, raw_message = record.split(b'\x1f', 3)
+        # A commit that repeats a task ID should still only be counted once for it
+        task_ids = {task_id.decode('ascii') for task_id in TASK_ID_BYTES_RE.findall(raw_message)}
+        if not task_ids:
+            continue
         
-        # Get task status and dates
-        task_status = getattr(issue.fields, 'status', None)
-        task_status_name = getattr(task_status, 'name', 'Unknown') if task_status else 'Unknown'
+        author_offset = int(tz[:1] + b'1') * (int(tz[1:3]) * 60 + int(tz[3:5]))  # "+HHMM" to minutes
+        commit = CommitRecord(hexsha.decode('ascii'), raw_message.decode('utf-8', 'replace'), int(authored_date), author_offset)
+        for task_id in task_ids:
+            commit_index.setdefault(task_id, []).append(commit)
+    
+    return commit_index
+
+def build_commit_index_pygit2(repo, start_ts, end_ts, author=None, head_sha=None, since_head=None):
+    """Index commits by task ID with a libgit2 revwalk instead of `git rev-list` subprocesses."""
+    # Same semantics as `git log --author`: a pattern searched in "Name <email>"
+    author_re = re.compile(author) if author else None
+    
+    walker = repo.walk(head_sha or repo.head.target, pygit2.GIT_SORT_TIME)
+    if since_head:
+        walker.hide(since_head)  # Everything reachable from the cached HEAD is already indexed
+    
+    commit_index = {}
+    for commit in walker:
+        # The walk is newest first by committer time, so the first commit before
+        # the window means every remaining ancestor is older still
+        if commit.commit_time < start_ts:
+            break
+        if commit.commit_time >= end_ts:
+            continue
         
-        created_date = getattr(issue.fields, 'created', None)
-        updated_date = getattr(issue.fields, 'updated', None)
-        resolved_date = getattr(issue.fields, 'resolved', None)
+        signature = commit.author
+        if author_re and not author_re.search(f"{signature.name} <{signature.email}>"):
+            continue
         
-        # Filter by date range
-        if not is_task_in_date_range(issue, start_date, end_date):
+        # Scan the raw bytes so only matching commits pay for decoding their message
+        task_ids = {task_id.decode('ascii') for task_id in TASK_ID_BYTES_RE.findall(commit.raw_message)}
+        if not task_ids:
             continue
         
-        task = {
-            'id': issue.key,
-            'title': issue.fields.summary,
-            'type': issue.fields.issuetype.name,
-            'priority': issue.fields.priority.name if issue.fields.priority else 'Medium',
-            'status': task_status_name,
-            'sprint_info': sprint_info,
-            'sprint_status': sprint_status,
-            'created_date': created_date,
-            'updated_date': updated_date,
-            'resolved_date': resolved_date,
-            'assignee_email': assignee,
-            **time_info
-        }
-        tasks.append(task)
+        record = CommitRecord(str(commit.id), commit.message, signature.time, signature.offset)
+        for task_id in task_ids:
+            commit_index.setdefault(task_id, []).append(record)
     
-    print(f"📊 Found {len(tasks)} relevant tasks for {assignee}")
-    
-    # Group by sprint status for reporting
-    sprint_summary = {}
-    for task in tasks:
-        status = task['sprint_status']
-        sprint_summary[status] = sprint_summary.get(status, 0) + 1
+    return commit_index
+
+def get_commit_cache_path(repo_path, start_ts, end_ts, author, project_prefix):
+    """Get the cache file path for one repository's commit index over a date range."""
+    cache_key = repr((COMMIT_CACHE_VERSION, os.path.abspath(repo_path), start_ts, end_ts, author, project_prefix))
+    key_hash = hashlib.sha256(cache_key.encode('utf-8')).hexdigest()
+    return os.path.join(COMMIT_CACHE_DIR, f"{key_hash}.pkl")
+
+def load_cached_commit_index(cache_path):
+    """Load a cached commit index as a dict with 'head' and 'index', or None if unavailable."""
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = pickle.load(f)
+        os.utime(cache_path)  # Mark as recently used for LRU eviction
+        return cached
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        return None
+
+def store_cached_commit_index(cache_path, head_sha, commit_index):
+    """Cache a commit index on disk, evicting the least recently used entries."""
+    tmp_path = None
+    try:
+        os.makedirs(COMMIT_CACHE_DIR, exist_ok=True)
+        
+        # Write to a temporary file first so concurrent runs never load a partial index
+        fd, tmp_path = tempfile.mkstemp(dir=COMMIT_CACHE_DIR, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump({'head': head_sha, 'index': commit_index}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+        tmp_path = None
+        
+        cached_files = [os.path.join(COMMIT_CACHE_DIR, name) for name in os.listdir(COMMIT_CACHE_DIR) if name.endswith('.pkl')]
+        cached_files.sort(key=os.path.getmtime, reverse=True)
+        for stale_file in cached_files[COMMIT_CACHE_MAX_ENTRIES:]:
+            os.remove(stale_file)
+    except (OSError, pickle.PicklingError) as e:
+        print(f"  ⚠️ Could not cache commit index: {e}")
+        # Do not leave a half-written temporary file behind in the cache directory
+        if tmp_path:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+def merge_commit_indexes(newer_index, older_index):
+    """Merge an incremental index into a cached one, keeping newest commits first."""
+    merged = dict(older_index)
+    for task_id, commits in newer_index.items():
+        merged[task_id] = commits + older_index.get(task_id, [])
+    return merged
+
+def build_repo_commit_index(repo_path, start_ts, end_ts, author=None, project_prefix=None):
+    """Build one repository's commit index, reusing and extending the cached index when possible."""
+    repo = open_repository(repo_path)
+    head_sha = get_head_sha(repo)
+    cache_path = get_commit_cache_path(repo_path, start_ts, end_ts, author, project_prefix)
+    
+    cached = load_cached_commit_index(cache_path)
+    if cached and cached['head'] == head_sha:
+        print(f"  📦 Reusing cached commit index for {repo_path}")
+        return cached['index']
+    
+    # Walk only the commits added since the cached HEAD when history was not rewritten
+    since_head = None
+    if cached and is_ancestor_commit(repo, cached['head'], head_sha):
+        since_head = cached['head']
+        print(f"  🔄 Indexing new commits since {since_head[:8]} in {repo_path}")
+    
+    # libgit2 walks in-process; `git log` is used without it, or when --grep can preselect commits
+    if PYGIT2_AVAILABLE and not project_prefix:
+        commit_index = build_commit_index_pygit2(repo, start_ts, end_ts, author, head_sha, since_head)
+    else:
+        commit_index = build_commit_index(repo_path, start_ts, end_ts, author, head_sha, since_head, project_prefix)
     
-    print(f"📈 Sprint distribution: {sprint_summary}")
+    if since_head:
+        commit_index = merge_commit_indexes(commit_index, cached['index'])
     
-    return tasks
+    store_cached_commit_index(cache_path, head_sha, commit_index)
+    return commit_index
 
-def fetch_commits_from_multiple_repos(repo_paths, task_id, start_date, end_date):
-    """Fetch commits from multiple Git repositories that mention the task ID and are within the date range."""
-    all_commits = []
-    repo_sources = {}
+def build_commit_indexes(repo_paths, start_ts, end_ts, author=None, project_prefix=None):
+    """Build a task ID commit index for every repository, keyed by repository name."""
+    import git  # Imported here so CLI startup does not pay for GitPython
     
-    for repo_path in repo_paths:
+    commit_indexes = {}
+    
+    with ThreadPoolExecutor(max_workers=max(1, min(GIT_INDEX_WORKERS, len(repo_paths)))) as executor:
+        futures = [(repo_path, executor.submit(build_repo_commit_index, repo_path, start_ts, end_ts, author, project_prefix))
+                   for repo_path in repo_paths]
+    
+    # Collected in argument order so the report lists repositories as they were given
+    for repo_path, future in futures:
         try:
-            repo = git.Repo(repo_path)
             repo_name = repo_path.split('/')[-1]  # Get repository name from path
-            commits = [c for c in repo.iter_commits(since=start_date, until=end_date) if task_id in c.message]
-            
-            if commits:
-                print(f"  📁 {repo_name}: {len(commits)} commits")
-                all_commits.extend(commits)
-                repo_sources[repo_name] = len(commits)
-            
+            commit_indexes[repo_name] = future.result()
         except (git.exc.InvalidGitRepositoryError, git.exc.NoSuchPathError) as e:
             print(f"  ⚠️ Skipping invalid repo {repo_path}: {e}")
         except Exception as e:
             print(f"  ⚠️ Error accessing repo {repo_path}: {e}")
     
+    return commit_indexes
+
+def fetch_commits_from_multiple_repos(commit_indexes, task_id, progress):
+    """Look up the commits mentioning the task ID in every indexed repository, adding progress lines to progress."""
+    all_commits = []
+    repo_sources = {}
+    
+    for repo_name, commit_index in commit_indexes.items():
+        commits = commit_index.get(task_id, [])
+        if commits:
+            progress.append(f"  📁 {repo_name}: {len(commits)} commits")
+            all_commits.extend(commits)
+            repo_sources[repo_name] = len(commits)
+    
     if repo_sources:
         sources_str = ", ".join([f"{name}({count})" for name, count in repo_sources.items()])
-        print(f"  🔍 Total: {len(all_commits)} commits from {sources_str}")
+        progress.append(f"  🔍 Total: {len(all_commits)} commits from {sources_str}")
     
     return all_commits, repo_sources
 
-def fetch_commits(repo, task_id, start_date, end_date):
-    """Fetch commits from Git that mention the task ID and are within the date range (single repo)."""
-    commits = [c for c in repo.iter_commits(since=start_date, until=end_date) if task_id in c.message]
-    return commits
-
 def estimate_realistic_time(commits, task_title, task_type, task_priority):
     """
     Estimate realistic time spent including all development activities.
@@ -336,9 +795,15 @@ def estimate_git_commit_time(commits):
     if len(commits) == 1:
         return 1.0  # Single commit represents focused work
     else:
-        times = [c.authored_datetime for c in commits]
-        first, last = min(times), max(times)
-        hours = (last - first).total_seconds() / 3600
+        # Track the earliest and latest commit in one pass without building a list
+        first = last = commits[0].authored_date
+        for commit in commits:  # Re-visiting the first commit is harmless and avoids copying a slice
+            authored = commit.authored_date
+            if authored < first:
+                first = authored
+            elif authored > last:
+                last = authored
+        hours = (last - first) / 3600
         
         if hours < 0.5:
             return max(len(commits) * 0.5, 1.0)
@@ -351,39 +816,24 @@ def estimate_git_commit_time(commits):
         else:
             return min(max(hours * 1.3, 2.0), 8.0)
 
+@lru_cache(maxsize=TASK_HEURISTIC_CACHE_SIZE)
 def get_complexity_multiplier(task_title, task_type):
     """Determine complexity multiplier based on task characteristics."""
     title_lower = task_title.lower()
     type_lower = task_type.lower()
     
-    # High complexity indicators
-    high_complexity_keywords = [
-        'integration', 'migration', 'refactor', 'architecture', 'security', 
-        'performance', 'optimization', 'algorithm', 'complex', 'system'
-    ]
-    
-    # Medium complexity indicators  
-    medium_complexity_keywords = [
-        'feature', 'implementation', 'enhancement', 'workflow', 'process',
-        'validation', 'authentication', 'database', 'api'
-    ]
-    
-    # Simple task indicators
-    simple_keywords = [
-        'fix', 'update', 'minor', 'text', 'styling', 'copy', 'simple'
-    ]
-    
-    if any(keyword in title_lower for keyword in high_complexity_keywords):
+    if HIGH_COMPLEXITY_RE.search(title_lower):
         return 1.8  # 80% more time for complex tasks
-    elif any(keyword in title_lower for keyword in medium_complexity_keywords):
+    elif MEDIUM_COMPLEXITY_RE.search(title_lower):
         return 1.4  # 40% more time for medium tasks
-    elif any(keyword in title_lower for keyword in simple_keywords):
+    elif SIMPLE_TASK_RE.search(title_lower):
         return 1.0  # Standard time for simple tasks
     elif 'story' in type_lower or 'epic' in type_lower:
         return 1.6  # Stories typically involve multiple aspects
     else:
         return 1.2  # Default slight increase
 
+@lru_cache(maxsize=TASK_HEURISTIC_CACHE_SIZE)
 def get_priority_multiplier(task_priority):
     """Adjust time based on priority (high priority often means more pressure/coordination)."""
     priority_lower = task_priority.lower()
@@ -395,6 +845,7 @@ def get_priority_multiplier(task_priority):
     else:
         return 1.0  # Standard time
 
+@lru_cache(maxsize=TASK_HEURISTIC_CACHE_SIZE)
 def get_minimum_task_time(task_type):
     """Minimum realistic time for any development task."""
     type_lower = task_type.lower()
@@ -411,13 +862,14 @@ def get_minimum_task_time(task_type):
     else:
         return 2.0  # Default minimum
 
+@lru_cache(maxsize=TASK_HEURISTIC_CACHE_SIZE)
 def get_base_task_time(task_title, task_type):
     """Estimate base time for tasks without commits (planning, analysis, etc.)."""
     type_lower = task_type.lower()
     title_lower = task_title.lower()
     
     # Research and planning tasks
-    if any(keyword in title_lower for keyword in ['research', 'analysis', 'planning', 'design', 'spec']):
+    if PLANNING_WORK_RE.search(title_lower):
         return 4.0
     elif 'epic' in type_lower:
         return 6.0  # Epic planning
@@ -433,15 +885,15 @@ def get_final_time_estimate(task, commits):
     """
     
     # Priority 1: Use actual logged time in JIRA (most accurate)
-    if task.get('jira_time_spent', 0) > 0:
+    if task['jira_time_spent'] > 0:
         return task['jira_time_spent']
     
     # Priority 2: Use aggregate time spent (includes subtasks)
-    if task.get('jira_aggregate_time', 0) > 0:
+    if task['jira_aggregate_time'] > 0:
         return task['jira_aggregate_time']
     
     # Priority 3: Use original estimate if it seems reasonable and no time logged
-    jira_estimate = task.get('jira_time_estimate', 0)
+    jira_estimate = task['jira_time_estimate']
     if jira_estimate > 0:
         # If there are commits, the work was likely done, so use the estimate
         if commits:
@@ -451,65 +903,91 @@ def get_final_time_estimate(task, commits):
             return jira_estimate * 0.2  # 20% for planning/analysis
     
     # Priority 4: Fall back to git-based realistic estimation
-    return estimate_realistic_time(commits, task['title'], task['type'], task['priority'])
+    # Pass the lowercased fields so differently cased titles share the heuristic cache entries
+    return estimate_realistic_time(commits, task['title_lower'], task['type_lower'], task['priority_lower'])
 
 def analyze_time_source(tasks):
     """Analyze what time sources were used for reporting transparency."""
     jira_logged = 0
-    jira_estimated = 0 
-    git_estimated = 0
+    jira_estimated = 0
     
     for task in tasks:
-        if task.get('jira_time_spent', 0) > 0 or task.get('jira_aggregate_time', 0) > 0:
+        if task['jira_time_spent'] > 0 or task['jira_aggregate_time'] > 0:
             jira_logged += 1
-        elif task.get('jira_time_estimate', 0) > 0:
+        elif task['jira_time_estimate'] > 0:
             jira_estimated += 1
-        else:
-            git_estimated += 1
     
     return {
         'jira_logged': jira_logged,
         'jira_estimated': jira_estimated,
-        'git_estimated': git_estimated,
+        'git_estimated': len(tasks) - jira_logged - jira_estimated,  # Everything else falls back to git
         'total': len(tasks)
     }
 
+def get_summary_cache_path(prompt):
+    """Get the cache file path for an AI summary prompt."""
+    prompt_hash = hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+    return os.path.join(SUMMARY_CACHE_DIR, f"{prompt_hash}.txt")
+
+def load_cached_summary(prompt):
+    """Load a cached AI summary for this prompt, or None if there is no fresh entry."""
+    cache_path = get_summary_cache_path(prompt)
+    try:
+        if time.time() - os.path.getmtime(cache_path) > SUMMARY_CACHE_TTL_SECONDS:
+            return None
+        with open(cache_path, encoding='utf-8') as f:
+            summary = f.read()
+        os.utime(cache_path)  # Mark as recently used for LRU eviction
+        return summary
+    except OSError:
+        return None
+
+def store_cached_summary(prompt, summary):
+    """Cache an AI summary on disk, evicting the least recently used entries."""
+    try:
+        os.makedirs(SUMMARY_CACHE_DIR, exist_ok=True)
+        
+        # Write to a temporary file first so concurrent runs never read a partial summary
+        fd, tmp_path = tempfile.mkstemp(dir=SUMMARY_CACHE_DIR, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(summary)
+        os.replace(tmp_path, get_summary_cache_path(prompt))
+        
+        cached_files = [os.path.join(SUMMARY_CACHE_DIR, name) for name in os.listdir(SUMMARY_CACHE_DIR) if name.endswith('.txt')]
+        cached_files.sort(key=os.path.getmtime, reverse=True)
+        for stale_file in cached_files[SUMMARY_CACHE_MAX_ENTRIES:]:
+            os.remove(stale_file)
+    except OSError as e:
+        print(f"⚠️ Could not cache AI summary: {e}")
+
 def generate_summary(tasks):
     """Generate a human-like summary using available AI APIs or fallback to template."""
     
-    # Analyze the actual work for specific insights
-    completed_tasks = [task for task in tasks if task.get('commits')]
-    total_time = sum(task['time'] for task in tasks if task['time'] > 0)
-    
-    # Extract specific work details for AI analysis
-    work_details = []
-    for task in completed_tasks[:10]:  # Focus on top completed tasks
-        commits_summary = []
-        if task.get('commits'):
-            for commit in task['commits'][:3]:  # Top 3 commits per task
-                commits_summary.append(commit.message.strip())
-        
-        work_details.append({
-            'title': task['title'],
-            'type': task['type'],
-            'time': task['time'],
-            'commits': commits_summary
-        })
+    # Analyze the actual work for specific insights, collecting completed tasks and time in one pass
+    completed_tasks = []
+    total_time = 0
+    for task in tasks:
+        if task['has_commits']:
+            completed_tasks.append(task)
+        if task['time'] > 0:
+            total_time += task['time']
     
-    # Create a rich prompt for AI analysis
-    prompt = f"""Analyze this development work and provide specific business insights:
+    # Create a rich prompt for AI analysis, collecting the parts and joining once
+    prompt_parts = [f"""Analyze this development work and provide specific business insights:
 
 CONTEXT: {len(completed_tasks)} completed tasks, {total_time:.1f} hours of development work
 
 COMPLETED WORK ANALYSIS:
-"""
+"""]
     
-    for work in work_details:
-        prompt += f"\nTask: {work['title']} ({work['type']}, {work['time']:.1f}h)\n"
-        if work['commits']:
-            prompt += f"Implementation: {'; '.join(work['commits'][:2])}\n"
+    # Extract specific work details for AI analysis
+    for task in completed_tasks[:10]:  # Focus on top completed tasks
+        prompt_parts.append(f"\nTask: {task['title']} ({task['type']}, {task['time']:.1f}h)\n")
+        commit_messages = [commit.message.strip() for commit in task['commits'][:2]]  # Top 2 commits per task
+        if commit_messages:
+            prompt_parts.append(f"Implementation: {'; '.join(commit_messages)}\n")
     
-    prompt += """
+    prompt_parts.append("""
 ANALYSIS REQUEST:
 1. What specific business capabilities were delivered?
 2. What user problems were solved?
@@ -517,7 +995,31 @@ ANALYSIS REQUEST:
 4. What strategic recommendations would you make based on this work?
 5. What potential risks or bottlenecks do you see?
 
-Provide a concise but specific summary that a stakeholder would find valuable for decision-making."""
+Provide a concise but specific summary that a stakeholder would find valuable for decision-making.""")
+    prompt = ''.join(prompt_parts)
+    
+    # Reports built in the same run ask about the same work; only ask the AI once
+    if prompt not in ai_summary_memo:
+        ai_summary_memo[prompt] = request_ai_summary(prompt)
+    summary = ai_summary_memo[prompt]
+    if summary is not None:
+        return summary
+    
+    # Enhanced fallback with specific analysis
+    print("📝 Using enhanced template-based summary")
+    return generate_enhanced_template_summary(tasks, completed_tasks, total_time)
+
+def request_ai_summary(prompt):
+    """Get a summary for the prompt from the cache, Gemini or OpenAI, or None if none is available."""
+    # Only runs that reach a summary pay for importing and configuring the AI SDKs
+    initialize_ai_clients()
+    
+    # Reuse the previous answer when the same work is reported again
+    if gemini_model or openai_client:
+        cached_summary = load_cached_summary(prompt)
+        if cached_summary is not None:
+            print("📝 AI-enhanced summary loaded from cache")
+            return cached_summary
     
     # Try Gemini first (free tier is generous)
     if gemini_model:
@@ -526,7 +1028,9 @@ Provide a concise but specific summary that a stakeholder would find valuable fo
                 f"You are a senior technical project manager analyzing development work for business stakeholders. {prompt}"
             )
             print("📝 AI-enhanced summary generated using Gemini")
-            return response.text.strip()
+            summary = response.text.strip()
+            store_cached_summary(prompt, summary)
+            return summary
         except Exception as e:
             print(f"Gemini API error: {e}")
     
@@ -534,45 +1038,49 @@ Provide a concise but specific summary that a stakeholder would find valuable fo
     if openai_client:
         try:
             response = openai_client.chat.completions.create(
-                model="gpt-3.5-turbo",
+                model=OPENAI_SUMMARY_MODEL,
                 messages=[
                     {"role": "system", "content": "You are a senior technical project manager who creates insightful development summaries for business stakeholders. Focus on specific achievements, business impact, and strategic insights."},
                     {"role": "user", "content": prompt}
                 ],
                 max_tokens=300,
-                temperature=0.7
+                temperature=0.7,
+                stream=True
             )
+            # Collect the streamed tokens as they arrive
+            parts = []
+            for chunk in response:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    parts.append(chunk.choices[0].delta.content)
             print("📝 AI-enhanced summary generated using OpenAI")
-            return response.choices[0].message.content.strip()
+            summary = ''.join(parts).strip()
+            store_cached_summary(prompt, summary)
+            return summary
         except Exception as e:
             print(f"OpenAI API error: {e}")
     
-    # Enhanced fallback with specific analysis
-    print("📝 Using enhanced template-based summary")
-    return generate_enhanced_template_summary(tasks, completed_tasks, total_time)
+    return None
+
+def classify_completed_work(completed_tasks):
+    """Count completed tasks and sum their time per work type (feature, improvement, security), in one pass."""
+    work_counts = Counter()
+    work_times = Counter()
+    for task in completed_tasks:
+        title_lower = task['title_lower']
+        for work_type, pattern in WORK_TYPE_PATTERNS:
+            if pattern.search(title_lower):
+                work_counts[work_type] += 1
+                work_times[work_type] += task['time']
+                break
+    return work_counts, work_times
 
 def generate_enhanced_template_summary(tasks, completed_tasks, total_time):
     """Generate an enhanced summary without AI that provides specific insights."""
     if not completed_tasks:
-        return "No tasks completed during this period."
+        return NO_TASKS_COMPLETED_MESSAGE
     
     # Analyze completed work for patterns
-    feature_keywords = ['feature', 'add', 'new', 'implement', 'create']
-    improvement_keywords = ['fix', 'improve', 'update', 'enhance', 'optimize']
-    security_keywords = ['security', 'auth', 'token', 'validation', 'access']
-    
-    feature_work = []
-    improvements = []
-    security_work = []
-    
-    for task in completed_tasks:
-        title_lower = task['title'].lower()
-        if any(keyword in title_lower for keyword in feature_keywords):
-            feature_work.append(task)
-        elif any(keyword in title_lower for keyword in improvement_keywords):
-            improvements.append(task)
-        elif any(keyword in title_lower for keyword in security_keywords):
-            security_work.append(task)
+    work_counts, work_times = classify_completed_work(completed_tasks)
     
     # Build specific summary
     summary_parts = []
@@ -583,17 +1091,14 @@ def generate_enhanced_template_summary(tasks, completed_tasks, total_time):
     summary_parts.append(f"Delivered {len(completed_tasks)} development initiatives with {total_time:.1f} hours of professional development work ({daily_avg:.1f}h/day average).")
     
     # Specific achievements
-    if feature_work:
-        feature_time = sum(t['time'] for t in feature_work)
-        summary_parts.append(f"New capabilities: {len(feature_work)} features developed ({feature_time:.1f}h investment), expanding platform functionality.")
+    if work_counts['feature']:
+        summary_parts.append(f"New capabilities: {work_counts['feature']} features developed ({work_times['feature']:.1f}h investment), expanding platform functionality.")
     
-    if improvements:
-        improvement_time = sum(t['time'] for t in improvements)
-        summary_parts.append(f"Platform enhancement: {len(improvements)} improvements implemented ({improvement_time:.1f}h investment), strengthening system reliability.")
+    if work_counts['improvement']:
+        summary_parts.append(f"Platform enhancement: {work_counts['improvement']} improvements implemented ({work_times['improvement']:.1f}h investment), strengthening system reliability.")
     
-    if security_work:
-        security_time = sum(t['time'] for t in security_work)
-        summary_parts.append(f"Security advancement: {len(security_work)} security enhancements ({security_time:.1f}h investment), improving system protection.")
+    if work_counts['security']:
+        summary_parts.append(f"Security advancement: {work_counts['security']} security enhancements ({work_times['security']:.1f}h investment), improving system protection.")
     
     # Development velocity insight
     if len(completed_tasks) >= 3:
@@ -626,18 +1131,20 @@ def generate_template_summary(tasks):
 
 def categorize_tasks_for_summary(tasks):
     """Categorize tasks for summary generation."""
-    bug_fixes = sum(1 for task in tasks if 'bug' in task['type'].lower() or 'defect' in task['type'].lower())
-    features = sum(1 for task in tasks if 'story' in task['type'].lower() or 'feature' in task['type'].lower())
+    # Count the issue types once, then classify each distinct type
+    bug_fixes = features = 0
+    for type_lower, count in Counter(task['type_lower'] for task in tasks).items():
+        if 'bug' in type_lower or 'defect' in type_lower:
+            bug_fixes += count
+        if 'story' in type_lower or 'feature' in type_lower:
+            features += count
     other = len(tasks) - bug_fixes - features
     return bug_fixes, features, other
 
 def build_task_summary_text(total_tasks, total_time):
     """Build the main summary text."""
-    summary = f"Completed {total_tasks} task{'s' if total_tasks != 1 else ''}"
-    if total_time > 0:
-        summary += f" with an estimated {total_time:.1f} hours of work"
-    summary += "."
-    return summary
+    time_text = f" with an estimated {total_time:.1f} hours of work" if total_time > 0 else ""
+    return f"Completed {total_tasks} task{'s' if total_tasks != 1 else ''}{time_text}."
 
 def build_task_details_text(bug_fixes, features, other):
     """Build the task details text."""
@@ -655,18 +1162,17 @@ def build_task_details_text(bug_fixes, features, other):
 
 def format_task_header(task):
     """Format the header information for a task."""
-    header = f"Task: {task['id']} - {task['title']}\n"
-    header += f"Type: {task['type']}\n"
-    header += f"Priority: {task['priority']}\n"
-    
     time_str = f"{task['time']:.1f} hours" if task['time'] > 0 else "no time estimated"
-    header += f"Estimated Time: {time_str}\n"
-    
-    return header
+    return (
+        f"Task: {task['id']} - {task['title']}\n"
+        f"Type: {task['type']}\n"
+        f"Priority: {task['priority']}\n"
+        f"Estimated Time: {time_str}\n"
+    )
 
 def format_repository_sources(task):
     """Format repository source information for a task."""
-    if not task.get('repo_sources'):
+    if not task['repo_sources']:
         return ""
     
     repo_info = []
@@ -681,35 +1187,40 @@ def format_repository_sources(task):
 
 def format_commits(task):
     """Format commit information for a task."""
-    commits_section = "Commits:\n"
+    lines = ["Commits:\n"]
     
     if task['commits']:
         for commit in task['commits']:
-            commit_time = commit.authored_datetime.strftime("%Y-%m-%d %H:%M")
-            commits_section += f"  - {commit.hexsha[:8]}: {commit.message.strip()} ({commit_time})\n"
+            author_tz = timezone(timedelta(minutes=commit.author_offset))
+            commit_time = datetime.fromtimestamp(commit.authored_date, author_tz).strftime("%Y-%m-%d %H:%M")
+            lines.append(f"  - {commit.hexsha[:8]}: {commit.message.strip()} ({commit_time})\n")
     else:
-        commits_section += "  No commits found for this task.\n"
+        lines.append("  No commits found for this task.\n")
     
-    return commits_section
+    return ''.join(lines)
 
-def build_report(tasks, summary):
-    """Build the technical report string."""
-    report = f"Work Report\nGenerated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-    report += f"Summary: {summary}\n\n"
-    report += "Details:\n"
+def build_report(tasks, summary, out=None):
+    """Write the technical report to out, or return it as a string when out is None."""
+    if out is None:
+        buffer = io.StringIO()
+        build_report(tasks, summary, buffer)
+        return buffer.getvalue()
+    
+    out.write(f"Work Report\nGenerated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+    out.write(f"Summary: {summary}\n\n")
+    out.write("Details:\n")
     
     total_time = 0
     for task in tasks:
-        report += format_task_header(task)
-        report += format_repository_sources(task)
-        report += format_commits(task)
-        report += "\n"
+        out.write(format_task_header(task))
+        out.write(format_repository_sources(task))
+        out.write(format_commits(task))
+        out.write("\n")
         
         if task['time'] > 0:
             total_time += task['time']
     
-    report += f"Total Estimated Time: {total_time:.1f} hours\n"
-    return report
+    out.write(f"Total Estimated Time: {total_time:.1f} hours\n")
 
 def get_business_categories():
     """Get the business impact categories configuration."""
@@ -746,36 +1257,76 @@ def get_business_categories():
         }
     }
 
+@lru_cache(maxsize=None)
+def get_business_category_matcher():
+    """Build one keyword pattern for all business categories, with each keyword's category rank."""
+    category_keys = list(get_business_categories())
+    keyword_ranks = {}
+    for rank, category in enumerate(get_business_categories().values()):
+        for keyword in category['keywords']:
+            keyword_ranks.setdefault(keyword, rank)
+    
+    # The lookahead reports a keyword at every position, and alternatives are listed by rank,
+    # so overlapping keywords that start at the same position resolve to the earliest category
+    pattern = re.compile('(?=(' + '|'.join(map(re.escape, keyword_ranks)) + '))')
+    return pattern, keyword_ranks, category_keys
+
+def find_best_keyword_rank(text, pattern, keyword_ranks):
+    """Return the best (lowest) category rank of any keyword in the text, or None."""
+    best_rank = None
+    for match in pattern.finditer(text):
+        rank = keyword_ranks[match.group(1)]
+        if best_rank is None or rank < best_rank:
+            best_rank = rank
+            if rank == 0:
+                break
+    return best_rank
+
 def categorize_tasks_by_business_value(tasks, categories):
-    """Categorize tasks by business value."""
+    """Categorize tasks by business value (the first category, in order, with a matching keyword)."""
+    pattern, keyword_ranks, category_keys = get_business_category_matcher()
     uncategorized = []
+    # Keywords contain no spaces, so the title and the type can be scanned separately;
+    # issue types repeat across tasks, so each type is scanned only once
+    type_ranks = {}
     for task in tasks:
-        categorized = False
-        task_text = f"{task['title']} {task['type']}".lower()
+        task_type = task['type_lower']
+        if task_type not in type_ranks:
+            type_ranks[task_type] = find_best_keyword_rank(task_type, pattern, keyword_ranks)
+        best_rank = type_ranks[task_type]
         
-        for category_key, category in categories.items():
-            if any(keyword in task_text for keyword in category['keywords']):
-                categories[category_key]['tasks'].append(task)
-                categorized = True
-                break
+        if best_rank != 0:
+            title_rank = find_best_keyword_rank(task['title_lower'], pattern, keyword_ranks)
+            if title_rank is not None and (best_rank is None or title_rank < best_rank):
+                best_rank = title_rank
         
-        if not categorized:
+        if best_rank is None:
             uncategorized.append(task)
+        else:
+            categories[category_keys[best_rank]]['tasks'].append(task)
     
     return uncategorized
 
 def calculate_business_metrics(tasks):
     """Calculate business metrics from tasks."""
-    total_completed = len([t for t in tasks if t.get('commits')])
-    total_time = sum(task['time'] for task in tasks if task['time'] > 0)
-    high_priority = len([t for t in tasks if t['priority'].lower() in ['high', 'highest']])
+    # One pass with plain counters instead of a throwaway list per metric
+    total_completed = high_priority = 0
+    total_time = 0
+    for task in tasks:
+        if task['has_commits']:
+            total_completed += 1
+        if task['time'] > 0:
+            total_time += task['time']
+        if task['priority_lower'] in HIGH_PRIORITIES:
+            high_priority += 1
     
+    total_tasks = len(tasks)
     return {
-        'total_tasks': len(tasks),
+        'total_tasks': total_tasks,
         'completed_tasks': total_completed,
         'total_time': total_time,
         'high_priority_tasks': high_priority,
-        'completion_rate': (total_completed / len(tasks) * 100) if tasks else 0
+        'completion_rate': (total_completed / total_tasks * 100) if tasks else 0
     }
 
 def analyze_business_impact(tasks):
@@ -810,21 +1361,20 @@ def generate_velocity_metrics(metrics):
     daily_velocity = metrics['total_time'] / working_days
     return f"• **Development Velocity**: {daily_velocity:.1f} hours/day sustained pace over {working_days} working days\n"
 
-def generate_repository_metrics(repo_distribution):
-    """Generate multi-repository metrics."""
-    if not repo_distribution or len(repo_distribution) <= 1:
+def generate_repository_metrics(sorted_repos):
+    """Generate multi-repository metrics from (repo, stats) pairs sorted by commit count."""
+    if not sorted_repos or len(sorted_repos) <= 1:
         return ""
     
-    sorted_repos = sorted(repo_distribution.items(), key=lambda x: x[1]['commits'], reverse=True)
     primary_repo = sorted_repos[0]
     
-    return (f"• **Technical Scope**: Full-stack development across {len(repo_distribution)} repositories\n"
+    return (f"• **Technical Scope**: Full-stack development across {len(sorted_repos)} repositories\n"
             f"• **Primary Focus**: {primary_repo[1]['commits']} commits in {primary_repo[0]} ({primary_repo[1]['time']:.1f}h)\n")
 
-def generate_pipeline_health_metrics(tasks):
+def generate_pipeline_health_metrics(partition):
     """Generate pipeline health metrics."""
-    active_tasks = len([t for t in tasks if t.get('commits') or t['time'] > 2.0])
-    planning_tasks = len(tasks) - active_tasks
+    active_tasks = partition['active_count']
+    planning_tasks = partition['planning_count']
     
     if planning_tasks > 0:
         return f"• **Pipeline Health**: {active_tasks} active development items, {planning_tasks} strategic planning items\n"
@@ -833,8 +1383,12 @@ def generate_pipeline_health_metrics(tasks):
 
 def generate_quality_metrics(completed_tasks):
     """Generate quality indicator metrics."""
-    bug_fixes = len([t for t in completed_tasks if 'bug' in t['type'].lower() or 'fix' in t['title'].lower()])
-    feature_work = len([t for t in completed_tasks if any(keyword in t['title'].lower() for keyword in ['add', 'create', 'implement', 'new'])])
+    bug_fixes = feature_work = 0
+    for t in completed_tasks:
+        if 'bug' in t['type_lower'] or 'fix' in t['title_lower']:
+            bug_fixes += 1
+        if any(keyword in t['title_lower'] for keyword in NEW_WORK_KEYWORDS):
+            feature_work += 1
     
     if feature_work > 0:
         return f"• **Innovation Focus**: {feature_work} new features delivered, {bug_fixes} stability improvements\n"
@@ -843,40 +1397,41 @@ def generate_quality_metrics(completed_tasks):
 
 def generate_time_tracking_methodology(time_sources):
     """Generate time tracking methodology section."""
-    section = "\n**Time Tracking Methodology**:\n"
+    parts = ["\n**Time Tracking Methodology**:\n"]
     
     if time_sources['jira_logged'] > 0:
-        section += f"• {time_sources['jira_logged']} tasks with logged JIRA time (most accurate)\n"
+        parts.append(f"• {time_sources['jira_logged']} tasks with logged JIRA time (most accurate)\n")
     
     if time_sources['git_estimated'] > 0:
-        section += f"• {time_sources['git_estimated']} tasks using enhanced development lifecycle estimation\n"
+        parts.append(f"• {time_sources['git_estimated']} tasks using enhanced development lifecycle estimation\n")
     
-    return section
+    return ''.join(parts)
 
-def generate_enhanced_success_metrics(tasks, business_analysis, completed_tasks, repo_distribution=None):
-    """Generate enhanced success metrics with better context."""
+def generate_enhanced_success_metrics(tasks, business_analysis, partition, sorted_repos=None):
+    """Generate enhanced success metrics chunks with better context."""
     metrics = business_analysis['metrics']
+    completed_tasks = partition['completed']
     time_sources = analyze_time_source(tasks)
     
-    report = "## SUCCESS METRICS & PERFORMANCE\n"
-    
-    report += generate_strategic_development_metrics(metrics, completed_tasks)
-    report += generate_velocity_metrics(metrics)
-    report += generate_repository_metrics(repo_distribution)
-    report += generate_pipeline_health_metrics(tasks)
-    report += generate_quality_metrics(completed_tasks)
-    report += generate_time_tracking_methodology(time_sources)
-    
-    report += "\n"
-    return report
+    return [
+        "## SUCCESS METRICS & PERFORMANCE\n",
+        generate_strategic_development_metrics(metrics, completed_tasks),
+        generate_velocity_metrics(metrics),
+        generate_repository_metrics(sorted_repos),
+        generate_pipeline_health_metrics(partition),
+        generate_quality_metrics(completed_tasks),
+        generate_time_tracking_methodology(time_sources),
+        "\n"
+    ]
 
-def generate_enhanced_stakeholder_summary(business_analysis, tasks, completed_tasks):
+def generate_enhanced_stakeholder_summary(business_analysis, partition):
     """Generate an enhanced stakeholder summary with better context and metrics."""
     metrics = business_analysis['metrics']
+    completed_tasks = partition['completed']
     
-    # Calculate more nuanced completion metrics
-    active_development_tasks = len([t for t in tasks if t.get('commits') or t['time'] > 2.0])
-    planning_tasks = len(tasks) - active_development_tasks
+    # More nuanced completion metrics
+    active_development_tasks = partition['active_count']
+    planning_tasks = partition['planning_count']
     
     summary_parts = []
     
@@ -908,67 +1463,74 @@ def format_report_header(assignee_name, period_str):
 
 def analyze_repository_distribution(tasks):
     """Analyze repository distribution from tasks."""
-    repo_distribution = {}
+    repo_distribution = defaultdict(lambda: {'commits': 0, 'tasks': 0, 'time': 0})
     total_commits = 0
     
     for task in tasks:
-        if task.get('repo_sources'):
-            for repo_name, commit_count in task['repo_sources'].items():
-                if repo_name not in repo_distribution:
-                    repo_distribution[repo_name] = {'commits': 0, 'tasks': 0, 'time': 0}
-                repo_distribution[repo_name]['commits'] += commit_count
-                repo_distribution[repo_name]['tasks'] += 1 if commit_count > 0 else 0
-                repo_distribution[repo_name]['time'] += task.get('time', 0)
-                total_commits += commit_count
+        repo_sources = task['repo_sources']
+        if not repo_sources:
+            continue
+        task_time = task['time']
+        for repo_name, commit_count in repo_sources.items():
+            repo_stats = repo_distribution[repo_name]
+            repo_stats['commits'] += commit_count
+            if commit_count > 0:
+                repo_stats['tasks'] += 1
+            repo_stats['time'] += task_time
+            total_commits += commit_count
     
-    return repo_distribution, total_commits
+    return dict(repo_distribution), total_commits
 
 def analyze_sprint_distribution(tasks):
-    """Analyze sprint distribution from tasks."""
-    sprint_distribution = {}
+    """Group tasks by sprint status, counting completed tasks and tracked time per group in the same pass."""
+    sprint_distribution = defaultdict(lambda: {'tasks': [], 'completed': 0, 'time': 0})
     for task in tasks:
-        status = task.get('sprint_status', 'Unknown')
-        if status not in sprint_distribution:
-            sprint_distribution[status] = []
-        sprint_distribution[status].append(task)
-    return sprint_distribution
-
-def generate_repository_context_section(repo_distribution, total_commits):
-    """Generate the repository context section."""
-    if len(repo_distribution) <= 1:
-        return ""
+        bucket = sprint_distribution[task['sprint_status']]
+        bucket['tasks'].append(task)
+        if task['is_done']:
+            bucket['completed'] += 1
+        if task['time'] > 0:
+            bucket['time'] += task['time']
+    return dict(sprint_distribution)
+
+def generate_repository_context_section(sorted_repos, total_commits):
+    """Generate the repository context section chunks from repositories sorted by commit count."""
+    if len(sorted_repos) <= 1:
+        return []
     
-    section = "## REPOSITORY CONTEXT\n"
-    sorted_repos = sorted(repo_distribution.items(), key=lambda x: x[1]['commits'], reverse=True)
+    parts = ["## REPOSITORY CONTEXT\n"]
     
     for repo_name, stats in sorted_repos:
         if stats['commits'] > 0:
             percentage = (stats['commits'] / total_commits * 100) if total_commits > 0 else 0
-            section += f"• **{repo_name}**: {stats['commits']} commits, {stats['tasks']} tasks, {stats['time']:.1f}h ({percentage:.1f}% of total commits)\n"
+            parts.append(f"• **{repo_name}**: {stats['commits']} commits, {stats['tasks']} tasks, {stats['time']:.1f}h ({percentage:.1f}% of total commits)\n")
     
-    return section + "\n"
+    parts.append("\n")
+    return parts
 
 def generate_sprint_context_section(sprint_distribution, assignee_name, tasks):
-    """Generate the sprint context section."""
-    section = "## SPRINT CONTEXT\n"
+    """Generate the sprint context section chunks."""
+    parts = ["## SPRINT CONTEXT\n"]
     
     if sprint_distribution:
-        for sprint_status, sprint_tasks in sprint_distribution.items():
-            completed_in_sprint = len([t for t in sprint_tasks if t.get('commits') or t.get('status', '').lower() in ['done', 'closed', 'resolved']])
-            total_time_in_sprint = sum(t['time'] for t in sprint_tasks if t.get('time', 0) > 0)
+        for sprint_status, bucket in sprint_distribution.items():
+            sprint_tasks = bucket['tasks']
+            completed_in_sprint = bucket['completed']
+            total_time_in_sprint = bucket['time']
             
             if sprint_status == "Closed":
-                section += f"• **Closed Sprint Work**: {completed_in_sprint}/{len(sprint_tasks)} tasks completed ({total_time_in_sprint:.1f}h delivered)\n"
+                parts.append(f"• **Closed Sprint Work**: {completed_in_sprint}/{len(sprint_tasks)} tasks completed ({total_time_in_sprint:.1f}h delivered)\n")
             elif sprint_status == "Active":
-                section += f"• **Current Sprint**: {completed_in_sprint}/{len(sprint_tasks)} tasks completed ({total_time_in_sprint:.1f}h invested)\n"
+                parts.append(f"• **Current Sprint**: {completed_in_sprint}/{len(sprint_tasks)} tasks completed ({total_time_in_sprint:.1f}h invested)\n")
             elif sprint_status == "Future":
-                section += f"• **Future Sprint**: {len(sprint_tasks)} tasks planned ({total_time_in_sprint:.1f}h estimated)\n"
+                parts.append(f"• **Future Sprint**: {len(sprint_tasks)} tasks planned ({total_time_in_sprint:.1f}h estimated)\n")
             else:
-                section += f"• **Other Work**: {completed_in_sprint}/{len(sprint_tasks)} tasks ({total_time_in_sprint:.1f}h)\n"
+                parts.append(f"• **Other Work**: {completed_in_sprint}/{len(sprint_tasks)} tasks ({total_time_in_sprint:.1f}h)\n")
     else:
-        section += f"• **Total Work Scope**: {len(tasks)} tasks assigned to {assignee_name}\n"
+        parts.append(f"• **Total Work Scope**: {len(tasks)} tasks assigned to {assignee_name}\n")
     
-    return section + "\n"
+    parts.append("\n")
+    return parts
 
 def generate_business_impact_areas_section(business_analysis, assignee_name):
     """Generate the business impact areas section."""
@@ -980,8 +1542,13 @@ def generate_business_impact_areas_section(business_analysis, assignee_name):
     impact_highlights = []
     for category_key, category in active_categories.items():
         task_count = len(category['tasks'])
-        completed_count = len([t for t in category['tasks'] if t.get('commits') or t.get('status', '').lower() in ['done', 'closed', 'resolved']])
-        time_spent = sum(t['time'] for t in category['tasks'] if t['time'] > 0)
+        completed_count = 0
+        time_spent = 0
+        for t in category['tasks']:
+            if t['is_done']:
+                completed_count += 1
+            if t['time'] > 0:
+                time_spent += t['time']
         
         if completed_count > 0:  # Only show categories with actual progress
             impact_highlights.append({
@@ -993,73 +1560,113 @@ def generate_business_impact_areas_section(business_analysis, assignee_name):
             })
     
     # Sort by completed tasks and time investment
-    impact_highlights.sort(key=lambda x: (x['completed'], x['time']), reverse=True)
+    impact_highlights.sort(key=itemgetter('completed', 'time'), reverse=True)
     
     for highlight in impact_highlights:
         summary_parts.append(f"• **{highlight['area']}**: {highlight['completed']} tasks completed - {highlight['time']:.1f}h development time")
     
     return "\n".join(summary_parts) + "\n\n"
 
-def generate_development_pipeline_section(tasks, completed_tasks):
-    """Generate the development pipeline section."""
-    if len(tasks) <= len(completed_tasks):
-        return ""
-    
-    pending_high_value = [t for t in tasks if not (t.get('commits') or t.get('status', '').lower() in ['done', 'closed', 'resolved']) and t.get('time', 0) > 2.0]
+def generate_development_pipeline_section(partition):
+    """Generate the development pipeline section chunks."""
+    pending_high_value = partition['pending_high_value']
     
     if not pending_high_value:
-        return ""
+        return []
     
-    section = "\n## DEVELOPMENT PIPELINE\n"
-    section += f"**High-Value Items Ready for Development** ({len(pending_high_value)} tasks):\n"
+    parts = ["\n## DEVELOPMENT PIPELINE\n"]
+    parts.append(f"**High-Value Items Ready for Development** ({len(pending_high_value)} tasks):\n")
     
     for task in pending_high_value[:5]:  # Top 5 pending items
-        sprint_context = f" [{task.get('sprint_status', 'Unknown')} Sprint]" if task.get('sprint_status') != 'Unknown' else ""
-        section += f"• {task['title']} ({task['time']:.1f}h estimated){sprint_context}\n"
+        sprint_context = f" [{task['sprint_status']} Sprint]" if task['sprint_status'] != 'Unknown' else ""
+        parts.append(f"• {task['title']} ({task['time']:.1f}h estimated){sprint_context}\n")
     
     if len(pending_high_value) > 5:
-        section += f"• ... and {len(pending_high_value) - 5} additional items\n"
+        parts.append(f"• ... and {len(pending_high_value) - 5} additional items\n")
     
-    return section + "\n"
+    parts.append("\n")
+    return parts
 
+@lru_cache(maxsize=None)
 def get_period_string(start_date, end_date):
     """Get formatted period string from date range."""
     try:
-        start_dt = datetime.strptime(start_date, '%Y-%m-%d')
-        end_dt = datetime.strptime(end_date, '%Y-%m-%d')
-        period_str = f"{start_dt.strftime('%B %Y')}"
-        if start_dt.month != end_dt.month or start_dt.year != end_dt.year:
-            period_str = f"{start_dt.strftime('%B %Y')} - {end_dt.strftime('%B %Y')}"
+        start_year, start_month = int(start_date[:4]), int(start_date[5:7])
+        end_year, end_month = int(end_date[:4]), int(end_date[5:7])
+        if start_date[4] != '-' or end_date[4] != '-' or not (0 < start_month < 13 and 0 < end_month < 13):
+            raise ValueError(start_date, end_date)
+        period_str = f"{MONTH_NAMES[start_month]} {start_year}"
+        if start_month != end_month or start_year != end_year:
+            period_str = f"{period_str} - {MONTH_NAMES[end_month]} {end_year}"
         return period_str
-    except ValueError:
+    except (ValueError, IndexError):
         return f"{start_date} to {end_date}"
 
 def get_assignee_name_from_tasks(tasks):
     """Extract assignee name from tasks."""
     if tasks and tasks[0].get('assignee_email'):
-        assignee_email = tasks[0]['assignee_email']
-        return assignee_email.split('@')[0].replace('.', ' ').title()
+        return get_assignee_name(tasks[0]['assignee_email'])
     return "Developer"
 
+@lru_cache(maxsize=None)
+def get_assignee_name(assignee_email):
+    """Turn an assignee email such as jane.doe@company.com into a display name."""
+    return assignee_email.split('@')[0].replace('.', ' ').title()
+
+def partition_report_tasks(tasks):
+    """Collect the task groups the stakeholder sections report on, in one pass."""
+    completed = []
+    pending_high_value = []
+    active_count = pending_priority_count = 0
+    completed_time = 0
+    
+    for task in tasks:
+        task_time = task['time']
+        
+        if task['is_done']:
+            completed.append(task)
+            completed_time += task_time
+        else:
+            if task_time > 2.0:
+                pending_high_value.append(task)
+            if task_time > 3.0:
+                pending_priority_count += 1
+        
+        # Active work has commits or enough time behind it; the rest is still being planned
+        if task['has_commits'] or task_time > 2.0:
+            active_count += 1
+    
+    return {
+        'completed': completed,
+        'completed_time': completed_time,
+        'active_count': active_count,
+        'planning_count': len(tasks) - active_count,
+        'pending_high_value': pending_high_value,
+        'pending_priority_count': pending_priority_count
+    }
+
 def generate_stakeholder_report(tasks, business_analysis, start_date, end_date):
     """Generate a stakeholder-focused report with business value emphasis."""
     
     # Basic report setup
+    partition = partition_report_tasks(tasks)
     period_str = get_period_string(start_date, end_date)
     assignee_name = get_assignee_name_from_tasks(tasks)
-    completed_tasks = [task for task in tasks if task.get('commits') or task.get('status', '').lower() in ['done', 'closed', 'resolved']]
+    completed_tasks = partition['completed']
     
     # Analyze distributions
     repo_distribution, total_commits = analyze_repository_distribution(tasks)
+    # Sort once; the context section and the success metrics both rank repositories by commits
+    sorted_repos = sorted(repo_distribution.items(), key=lambda x: x[1]['commits'], reverse=True)
     sprint_distribution = analyze_sprint_distribution(tasks)
     
-    # Build report
-    report = format_report_header(assignee_name, period_str)
-    report += generate_repository_context_section(repo_distribution, total_commits)
-    report += generate_sprint_context_section(sprint_distribution, assignee_name, tasks)
+    # Build report from section chunks, joined once at the end
+    parts = [format_report_header(assignee_name, period_str)]
+    parts.extend(generate_repository_context_section(sorted_repos, total_commits))
+    parts.extend(generate_sprint_context_section(sprint_distribution, assignee_name, tasks))
     
     # Enhanced Executive Summary with assignee focus
-    enhanced_summary = generate_enhanced_stakeholder_summary(business_analysis, tasks, completed_tasks)
+    enhanced_summary = generate_enhanced_stakeholder_summary(business_analysis, partition)
     enhanced_summary[0] = f"## EXECUTIVE SUMMARY - {assignee_name.upper()}'S CONTRIBUTIONS"
     
     # Add multi-repo context to executive summary if applicable
@@ -1067,289 +1674,127 @@ def generate_stakeholder_report(tasks, business_analysis, start_date, end_date):
         multi_repo_context = f"**Full-Stack Development**: {total_commits} commits across {len(repo_distribution)} repositories demonstrating comprehensive system knowledge."
         enhanced_summary.insert(1, multi_repo_context)
     
-    report += "\n".join(enhanced_summary) + "\n\n"
+    parts.append("\n".join(enhanced_summary) + "\n\n")
     
     # AI-Generated Strategic Analysis (if available)
     if len(completed_tasks) > 0:
         ai_summary = generate_summary(tasks)
         if ai_summary and "Business Insights" in ai_summary:
-            report += f"## STRATEGIC ANALYSIS - {assignee_name.upper()}'S IMPACT\n"
-            report += ai_summary + "\n\n"
+            parts.append(f"## STRATEGIC ANALYSIS - {assignee_name.upper()}'S IMPACT\n")
+            parts.append(ai_summary + "\n\n")
     
     # Add remaining sections
-    report += generate_business_impact_areas_section(business_analysis, assignee_name)
-    report += generate_detailed_impact_analysis(business_analysis['categories'])
-    report += generate_enhanced_success_metrics(tasks, business_analysis, completed_tasks, repo_distribution)
-    report += generate_sprint_aware_recommendations(tasks, business_analysis['categories'], sprint_distribution)
-    report += generate_development_pipeline_section(tasks, completed_tasks)
+    parts.append(generate_business_impact_areas_section(business_analysis, assignee_name))
+    parts.extend(generate_detailed_impact_analysis(business_analysis['categories']))
+    parts.extend(generate_enhanced_success_metrics(tasks, business_analysis, partition, sorted_repos))
+    parts.append(generate_sprint_aware_recommendations(tasks, business_analysis['categories'], sprint_distribution, partition))
+    parts.extend(generate_development_pipeline_section(partition))
     
-    return report
+    return ''.join(parts)
 
 def extract_action_and_objects(title_lower):
     """Extract action words and object combinations from task title."""
     title_words = title_lower.split()
-    action_words = ['add', 'create', 'implement', 'build', 'develop', 'fix', 'update', 'improve', 'enhance', 'optimize']
     object_words = []
+    if ACTION_WORDS.isdisjoint(title_words):
+        return object_words
     
     for i, word in enumerate(title_words):
-        if word in action_words and i + 1 < len(title_words):
+        if word in ACTION_WORDS and i + 1 < len(title_words):
             obj = ' '.join(title_words[i+1:i+4])
             if len(obj) > 3:
                 object_words.append(f"{word} {obj}")
     
     return object_words
 
-def get_revenue_sales_value(title_lower, object_words):
-    """Get business value for Revenue & Sales category."""
-    if any(term in title_lower for term in ['discount', 'coupon', 'promo']):
-        context = next((obj for obj in object_words if any(term in obj for term in ['discount', 'coupon', 'promo'])), 'promotional system')
-        return f"Enhanced promotional capabilities through {context}, driving sales conversion and customer acquisition"
-    elif 'cart' in title_lower:
-        context = next((obj for obj in object_words if 'cart' in obj), 'shopping cart functionality')
-        return f"Improved shopping experience via {context}, reducing cart abandonment and increasing completion rates"
-    elif any(term in title_lower for term in ['payment', 'billing', 'checkout']):
-        context = next((obj for obj in object_words if any(term in obj for term in ['payment', 'billing', 'checkout'])), 'payment processing')
-        return f"Streamlined {context} for better user experience and increased transaction success rates"
-    return None
-
-def get_user_experience_value(title_lower, object_words):
-    """Get business value for User Experience category."""
-    if any(term in title_lower for term in ['login', 'auth', 'session']):
-        context = next((obj for obj in object_words if any(term in obj for term in ['login', 'auth', 'session'])), 'authentication system')
-        return f"Enhanced user access through {context}, improving security and user experience"
-    elif any(term in title_lower for term in ['ui', 'interface', 'design', 'theme']):
-        context = next((obj for obj in object_words if any(term in obj for term in ['ui', 'interface', 'design', 'theme'])), 'user interface')
-        return f"Improved {context} for better user engagement and platform usability"
-    elif any(term in title_lower for term in ['template', 'layout']):
-        context = next((obj for obj in object_words if any(term in obj for term in ['template', 'layout'])), 'template system')
-        return f"Expanded design capabilities through {context}, providing more user customization options"
-    return None
-
-def get_security_compliance_value(title_lower, object_words):
-    """Get business value for Security & Compliance category."""
-    if any(term in title_lower for term in ['token', 'jwt', 'auth']):
-        context = next((obj for obj in object_words if any(term in obj for term in ['token', 'jwt', 'auth'])), 'authentication security')
-        return f"Strengthened {context} infrastructure, improving access controls and data protection"
-    elif any(term in title_lower for term in ['validation', 'verify']):
-        context = next((obj for obj in object_words if any(term in obj for term in ['validation', 'verify'])), 'validation system')
-        return f"Enhanced {context} for improved data integrity and security compliance"
-    elif any(term in title_lower for term in ['cookie', 'session', 'privacy']):
-        context = next((obj for obj in object_words if any(term in obj for term in ['cookie', 'session', 'privacy'])), 'privacy controls')
-        return f"Improved {context} for better data handling and regulatory compliance"
-    return None
-
-def get_operational_efficiency_value(title_lower, object_words):
-    """Get business value for Operational Efficiency category."""
-    if 'admin' in title_lower:
-        context = next((obj for obj in object_words if 'admin' in obj), 'administrative functionality')
-        return f"Enhanced {context} for improved workflow efficiency and system management"
-    elif any(term in title_lower for term in ['filter', 'search', 'crud']):
-        context = next((obj for obj in object_words if any(term in obj for term in ['filter', 'search', 'crud'])), 'data management tools')
-        return f"Improved {context} for enhanced operational productivity and data access"
-    elif any(term in title_lower for term in ['automation', 'cron', 'batch']):
-        context = next((obj for obj in object_words if any(term in obj for term in ['automation', 'cron', 'batch'])), 'automated processes')
-        return f"Implemented {context} to reduce manual overhead and increase operational efficiency"
-    return None
-
-def get_platform_stability_value(title_lower, object_words):
-    """Get business value for Platform Stability category."""
-    if any(term in title_lower for term in ['bug', 'fix', 'error']):
-        context = next((obj for obj in object_words if any(term in obj for term in ['bug', 'fix', 'error'])), 'system issues')
-        return f"Resolved {context} to improve platform reliability and user experience"
-    elif any(term in title_lower for term in ['performance', 'optimize', 'speed']):
-        context = next((obj for obj in object_words if any(term in obj for term in ['performance', 'optimize', 'speed'])), 'system performance')
-        return f"Optimized {context} for improved responsiveness and user satisfaction"
-    elif any(term in title_lower for term in ['storage', 'database', 'cache']):
-        context = next((obj for obj in object_words if any(term in obj for term in ['storage', 'database', 'cache'])), 'data infrastructure')
-        return f"Enhanced {context} for better system stability and data management"
-    return None
-
-def get_feature_expansion_value(title_lower, object_words):
-    """Get business value for Feature Expansion category."""
-    if any(term in title_lower for term in ['new', 'add', 'create']):
-        context = next((obj for obj in object_words if any(term in obj for term in ['new', 'add', 'create'])), 'platform capabilities')
-        return f"Expanded {context} to provide additional user value and functionality"
-    elif any(term in title_lower for term in ['implement', 'develop', 'build']):
-        context = next((obj for obj in object_words if any(term in obj for term in ['implement', 'develop', 'build'])), 'new functionality')
-        return f"Delivered {context} to enhance platform offerings and user experience"
-    return None
-
-def extract_specific_business_value(task_title, category):
-    """Extract specific business value from task titles with more detailed analysis."""
-    title_lower = task_title.lower()
-    object_words = extract_action_and_objects(title_lower)
-    
-    # Category-specific transformations
-    category_handlers = {
-        "Revenue & Sales": get_revenue_sales_value,
-        "User Experience": get_user_experience_value,
-        "Security & Compliance": get_security_compliance_value,
-        "Operational Efficiency": get_operational_efficiency_value,
-        "Platform Stability": get_platform_stability_value,
-        "Feature Expansion": get_feature_expansion_value
-    }
-    
-    handler = category_handlers.get(category)
-    if handler:
-        result = handler(title_lower, object_words)
-        if result:
-            return result
-    
-    # Enhanced fallback with more context
-    cleaned_title = task_title.replace("TD-", "").replace("SSW-", "").replace("PROJ-", "")
-    if object_words:
-        main_work = object_words[0]
-        return f"Completed {main_work} to enhance platform capabilities and business value"
-    else:
-        return f"Delivered {cleaned_title.lower()} to improve platform functionality and user experience"
-
-def transform_revenue_sales_value(title_lower):
-    """Transform revenue and sales task titles to business value."""
-    if "discount" in title_lower or "coupon" in title_lower:
-        return "Enhanced promotional capabilities to drive sales conversion"
-    elif "cart" in title_lower:
-        return "Improved shopping experience to reduce cart abandonment"
-    elif "payment" in title_lower or "billing" in title_lower:
-        return "Streamlined payment processing for better user experience"
-    return None
-
-def transform_user_experience_value(title_lower):
-    """Transform user experience task titles to business value."""
-    if "login" in title_lower or "session" in title_lower:
-        return "Improved user authentication and session management"
-    elif "thumbnail" in title_lower or "theme" in title_lower:
-        return "Enhanced visual presentation and user interface"
-    elif "template" in title_lower:
-        return "Expanded design options for better user engagement"
-    return None
-
-def transform_security_compliance_value(title_lower):
-    """Transform security and compliance task titles to business value."""
-    if "token" in title_lower or "auth" in title_lower:
-        return "Strengthened security infrastructure and access controls"
-    elif "validation" in title_lower:
-        return "Enhanced data validation and security measures"
-    elif "cookie" in title_lower:
-        return "Improved secure data handling and privacy compliance"
-    return None
-
-def transform_operational_efficiency_value(title_lower):
-    """Transform operational efficiency task titles to business value."""
-    if "admin" in title_lower:
-        return "Enhanced administrative capabilities and workflow efficiency"
-    elif "filter" in title_lower or "crud" in title_lower:
-        return "Improved data management and operational tools"
-    elif "cron" in title_lower or "automation" in title_lower:
-        return "Automated processes to reduce manual overhead"
-    return None
-
-def transform_platform_stability_value(title_lower):
-    """Transform platform stability task titles to business value."""
-    if "bug" in title_lower or "fix" in title_lower:
-        return "Resolved critical issues to improve system reliability"
-    elif "error" in title_lower:
-        return "Enhanced error handling and user experience"
-    elif "performance" in title_lower:
-        return "Optimized system performance and responsiveness"
-    return None
-
-def transform_feature_expansion_value(title_lower):
-    """Transform feature expansion task titles to business value."""
-    if "new" in title_lower or "add" in title_lower:
-        return "Expanded platform capabilities and user options"
-    elif "implement" in title_lower or "create" in title_lower:
-        return "Delivered new functionality to enhance user value"
-    return None
+def find_value_context(terms_re, title_lower, object_words, default_context):
+    """Return the first action phrase matching the rule's terms (or the default) if the title does, else None."""
+    if not terms_re.search(title_lower):
+        return None
+    return next((obj for obj in object_words if terms_re.search(obj)), default_context)
 
+@lru_cache(maxsize=BUSINESS_VALUE_CACHE_SIZE)
 def transform_to_business_value(technical_title, category):
     """Transform technical task titles into business value statements."""
-    
-    # Try enhanced extraction first
-    enhanced_value = extract_specific_business_value(technical_title, category)
-    if enhanced_value:
-        return enhanced_value
-    
-    # Fallback to original transformation functions
     title_lower = technical_title.lower()
+    object_words = extract_action_and_objects(title_lower)
     
-    transformation_functions = {
-        "Revenue & Sales": transform_revenue_sales_value,
-        "User Experience": transform_user_experience_value,
-        "Security & Compliance": transform_security_compliance_value,
-        "Operational Efficiency": transform_operational_efficiency_value,
-        "Platform Stability": transform_platform_stability_value,
-        "Feature Expansion": transform_feature_expansion_value
-    }
-    
-    transform_func = transformation_functions.get(category)
-    if transform_func:
-        result = transform_func(title_lower)
-        if result:
-            return result
+    for terms_re, default_context, template in BUSINESS_VALUE_RULES.get(category, ()):
+        context = find_value_context(terms_re, title_lower, object_words, default_context)
+        if context:
+            return template.format(context)
     
-    # Final fallback
-    return technical_title.replace("TD-", "").replace("Add ", "Added ").replace("Fix ", "Fixed ").replace("Update ", "Updated ")
+    # Fallback with more context
+    if object_words:
+        return f"Completed {object_words[0]} to enhance platform capabilities and business value"
+    cleaned_title = technical_title.replace("TD-", "").replace("SSW-", "").replace("PROJ-", "")
+    return f"Delivered {cleaned_title.lower()} to improve platform functionality and user experience"
 
 def generate_detailed_impact_analysis(categories):
-    """Generate the detailed impact analysis section of the report."""
-    report = "## DETAILED IMPACT ANALYSIS\n\n"
+    """Generate the detailed impact analysis section chunks of the report."""
+    parts = ["## DETAILED IMPACT ANALYSIS\n\n"]
     
     for category_key, category in categories.items():
         if not category['tasks']:
             continue
             
-        report += f"### {category['impact']}\n"
+        parts.append(f"### {category['impact']}\n")
         
-        # Category summary
-        completed = len([t for t in category['tasks'] if t.get('commits')])
+        # Category summary, gathered in one pass over the category's tasks
+        completed = 0
+        time_invested = 0
+        completed_tasks = []
+        for t in category['tasks']:
+            if t['has_commits']:
+                completed += 1
+            if t['time'] > 0:
+                time_invested += t['time']
+            if t['is_done']:
+                completed_tasks.append(t)
         total = len(category['tasks'])
-        time_invested = sum(t['time'] for t in category['tasks'] if t['time'] > 0)
         
-        report += f"**Status**: {completed}/{total} completed | **Time Investment**: {time_invested:.1f} hours\n\n"
+        parts.append(f"**Status**: {completed}/{total} completed | **Time Investment**: {time_invested:.1f} hours\n\n")
         
         # Key achievements
-        completed_tasks = [t for t in category['tasks'] if t.get('commits') or t.get('status', '').lower() in ['done', 'closed', 'resolved']]
         if completed_tasks:
-            report += "**Key Achievements**:\n"
+            parts.append("**Key Achievements**:\n")
             for task in completed_tasks[:3]:  # Top 3 completed tasks
                 # Transform technical title to business value
                 business_value = transform_to_business_value(task['title'], category['impact'])
-                report += f"• {business_value}\n"
+                parts.append(f"• {business_value}\n")
             
             if len(completed_tasks) > 3:
-                report += f"• ... and {len(completed_tasks) - 3} additional improvements\n"
+                parts.append(f"• ... and {len(completed_tasks) - 3} additional improvements\n")
         
         # Pending items
-        pending_tasks = [t for t in category['tasks'] if not t.get('commits')]
-        if pending_tasks:
-            report += f"\n**Pending Items** ({len(pending_tasks)} tasks): Strategic initiatives ready for next phase\n"
+        pending_count = total - completed
+        if pending_count:
+            parts.append(f"\n**Pending Items** ({pending_count} tasks): Strategic initiatives ready for next phase\n")
         
-        report += "\n"
+        parts.append("\n")
     
-    return report
+    return parts
 
 def analyze_sprint_progress(sprint_distribution):
     """Analyze current sprint progress."""
     recommendations = []
     
-    active_sprint_tasks = sprint_distribution.get('Active', [])
-    if active_sprint_tasks:
-        active_completed = len([t for t in active_sprint_tasks if t.get('commits') or t.get('status', '').lower() in ['done', 'closed', 'resolved']])
-        active_pending = len(active_sprint_tasks) - active_completed
+    active_sprint = sprint_distribution.get('Active')
+    if active_sprint:
+        active_pending = len(active_sprint['tasks']) - active_sprint['completed']
         if active_pending > 0:
             recommendations.append(f"• **Current Sprint Focus**: {active_pending} tasks remaining in active sprint (priority completion)")
     
     return recommendations
 
-def analyze_pending_priorities(tasks):
+def analyze_pending_priorities(partition):
     """Analyze pending high-priority tasks."""
     recommendations = []
     
-    uncompleted = [t for t in tasks if not (t.get('commits') or t.get('status', '').lower() in ['done', 'closed', 'resolved'])]
-    high_value_pending = [t for t in uncompleted if t.get('time', 0) > 3.0]
+    high_value_pending = partition['pending_priority_count']
     
     if high_value_pending:
-        recommendations.append(f"• **Priority Development**: {len(high_value_pending)} high-value items ready for next sprint")
+        recommendations.append(f"• **Priority Development**: {high_value_pending} high-value items ready for next sprint")
     
     return recommendations
 
@@ -1357,24 +1802,28 @@ def analyze_category_recommendations(categories):
     """Analyze category-based strategic recommendations."""
     recommendations = []
     
-    revenue_pending = [t for t in categories['revenue_generation']['tasks'] if not (t.get('commits') or t.get('status', '').lower() in ['done', 'closed', 'resolved'])]
+    revenue_pending = 0
+    revenue_time = 0
+    for t in categories['revenue_generation']['tasks']:
+        if not t['is_done']:
+            revenue_pending += 1
+            revenue_time += t['time']
     if revenue_pending:
-        revenue_time = sum(t['time'] for t in revenue_pending)
-        recommendations.append(f"• **Revenue Acceleration**: {len(revenue_pending)} revenue-impacting features ({revenue_time:.1f}h investment) in development pipeline")
+        recommendations.append(f"• **Revenue Acceleration**: {revenue_pending} revenue-impacting features ({revenue_time:.1f}h investment) in development pipeline")
     
-    security_pending = [t for t in categories['security_compliance']['tasks'] if not (t.get('commits') or t.get('status', '').lower() in ['done', 'closed', 'resolved'])]
+    security_pending = sum(1 for t in categories['security_compliance']['tasks'] if not t['is_done'])
     if security_pending:
-        recommendations.append(f"• **Security Roadmap**: {len(security_pending)} security enhancements planned for implementation")
+        recommendations.append(f"• **Security Roadmap**: {security_pending} security enhancements planned for implementation")
     
     return recommendations
 
-def analyze_velocity_insights(tasks):
+def analyze_velocity_insights(partition):
     """Analyze development velocity insights."""
     recommendations = []
     
-    completed_tasks = [t for t in tasks if t.get('commits') or t.get('status', '').lower() in ['done', 'closed', 'resolved']]
-    if len(completed_tasks) >= 3:
-        avg_completion_time = sum(t['time'] for t in completed_tasks) / len(completed_tasks)
+    completed_count = len(partition['completed'])
+    if completed_count >= 3:
+        avg_completion_time = partition['completed_time'] / completed_count
         estimated_sprint_capacity = (10 * 5) / avg_completion_time  # Assuming 2-week sprint, 5h/day
         recommendations.append(f"• **Sprint Planning**: Based on current complexity, estimated capacity of {estimated_sprint_capacity:.0f}-{estimated_sprint_capacity*1.2:.0f} similar tasks per sprint")
     
@@ -1384,31 +1833,27 @@ def analyze_sprint_performance(sprint_distribution):
     """Analyze sprint completion performance."""
     recommendations = []
     
-    closed_sprint_tasks = sprint_distribution.get('Closed', [])
-    if closed_sprint_tasks:
-        closed_completed = len([t for t in closed_sprint_tasks if t.get('commits') or t.get('status', '').lower() in ['done', 'closed', 'resolved']])
-        closed_completion_rate = (closed_completed / len(closed_sprint_tasks) * 100) if closed_sprint_tasks else 0
+    closed_sprint = sprint_distribution.get('Closed')
+    if closed_sprint:
+        closed_completion_rate = closed_sprint['completed'] / len(closed_sprint['tasks']) * 100
         recommendations.append(f"• **Sprint Performance**: {closed_completion_rate:.1f}% completion rate in closed sprints demonstrates consistent delivery")
     
     return recommendations
 
-def generate_sprint_aware_recommendations(tasks, categories, sprint_distribution):
+def generate_sprint_aware_recommendations(tasks, categories, sprint_distribution, partition=None):
     """Generate sprint-aware recommendations section."""
-    report = "## STRATEGIC RECOMMENDATIONS\n"
+    if partition is None:
+        partition = partition_report_tasks(tasks)
     
     all_recommendations = []
     all_recommendations.extend(analyze_sprint_progress(sprint_distribution))
-    all_recommendations.extend(analyze_pending_priorities(tasks))
+    all_recommendations.extend(analyze_pending_priorities(partition))
     all_recommendations.extend(analyze_category_recommendations(categories))
-    all_recommendations.extend(analyze_velocity_insights(tasks))
+    all_recommendations.extend(analyze_velocity_insights(partition))
     all_recommendations.extend(analyze_sprint_performance(sprint_distribution))
+    all_recommendations.append("• **Development Excellence**: Strong foundation established for continued feature development and platform enhancement\n")
     
-    for recommendation in all_recommendations:
-        report += recommendation + "\n"
-    
-    report += "• **Development Excellence**: Strong foundation established for continued feature development and platform enhancement\n\n"
-    
-    return report
+    return "## STRATEGIC RECOMMENDATIONS\n" + "\n".join(all_recommendations) + "\n"
 
 def generate_recommendations_section(tasks, categories):
     """Generate the next phase recommendations section (fallback function)."""
@@ -1416,69 +1861,14 @@ def generate_recommendations_section(tasks, categories):
     return generate_sprint_aware_recommendations(tasks, categories, {})
 
 def generate_enhanced_business_summary(tasks, completed_tasks):
-    """Generate an enhanced business summary without AI that provides specific insights."""
-    if not completed_tasks:
-        return NO_TASKS_COMPLETED_MESSAGE
-    
-    # Calculate metrics
+    """Generate an enhanced business summary without AI, totalling the tracked time itself."""
     total_time = sum(task['time'] for task in tasks if task['time'] > 0)
-    
-    # Analyze completed work for patterns
-    feature_keywords = ['feature', 'add', 'new', 'implement', 'create']
-    improvement_keywords = ['fix', 'improve', 'update', 'enhance', 'optimize']
-    security_keywords = ['security', 'auth', 'token', 'validation', 'access']
-    
-    feature_work = []
-    improvements = []
-    security_work = []
-    
-    for task in completed_tasks:
-        title_lower = task['title'].lower()
-        if any(keyword in title_lower for keyword in feature_keywords):
-            feature_work.append(task)
-        elif any(keyword in title_lower for keyword in improvement_keywords):
-            improvements.append(task)
-        elif any(keyword in title_lower for keyword in security_keywords):
-            security_work.append(task)
-    
-    # Build specific summary
-    summary_parts = []
-    
-    # Overview
-    working_days = 22
-    daily_avg = total_time / working_days
-    summary_parts.append(f"Delivered {len(completed_tasks)} development initiatives with {total_time:.1f} hours of professional development work ({daily_avg:.1f}h/day average).")
-    
-    # Specific achievements
-    if feature_work:
-        feature_time = sum(t['time'] for t in feature_work)
-        summary_parts.append(f"New capabilities: {len(feature_work)} features developed ({feature_time:.1f}h investment), expanding platform functionality.")
-    
-    if improvements:
-        improvement_time = sum(t['time'] for t in improvements)
-        summary_parts.append(f"Platform enhancement: {len(improvements)} improvements implemented ({improvement_time:.1f}h investment), strengthening system reliability.")
-    
-    if security_work:
-        security_time = sum(t['time'] for t in security_work)
-        summary_parts.append(f"Security advancement: {len(security_work)} security enhancements ({security_time:.1f}h investment), improving system protection.")
-    
-    # Development velocity insight
-    if len(completed_tasks) >= 3:
-        avg_task_time = total_time / len(completed_tasks)
-        if avg_task_time > 8:
-            summary_parts.append(f"Development pattern: Complex feature work averaging {avg_task_time:.1f}h per task, indicating substantial technical implementations.")
-        elif avg_task_time < 3:
-            summary_parts.append(f"Development pattern: Efficient task completion averaging {avg_task_time:.1f}h per task, showing optimized development velocity.")
-        else:
-            summary_parts.append(f"Development pattern: Balanced development approach averaging {avg_task_time:.1f}h per task, maintaining steady delivery pace.")
-    
-    return " ".join(summary_parts)
+    return generate_enhanced_template_summary(tasks, completed_tasks, total_time)
 
 def parse_repository_arguments(args):
-    """Parse and validate repository path arguments."""
-    repo_paths = []
-    if args.repos:
-        repo_paths = [path.strip() for path in args.repos.split(',')]
+    """Report the repository paths, already split by the argument parser."""
+    repo_paths = args.repos
+    if repo_paths:
         print(f"🔧 Multi-repository mode: {len(repo_paths)} repositories")
         for i, path in enumerate(repo_paths, 1):
             print(f"   {i}. {path}")
@@ -1493,7 +1883,7 @@ def validate_repositories(repo_paths):
     valid_repos = []
     for repo_path in repo_paths:
         try:
-            git.Repo(repo_path)  # Just validate, don't store the repo object
+            open_repository(repo_path)  # Opened once here and reused when indexing
             valid_repos.append(repo_path)
             print(f"✅ Valid repository: {repo_path}")
         except Exception as e:
@@ -1505,37 +1895,43 @@ def validate_repositories(repo_paths):
     
     return valid_repos
 
-def process_task_commits(tasks, repo_paths, start_date, end_date):
-    """Process commits for all tasks across multiple repositories."""
-    print(f"\n🔍 Analyzing commits across {len(repo_paths)} repositories...")
+def process_task_commits(tasks, commit_indexes):
+    """Attach commits from the prebuilt repository indexes to every task."""
+    print(f"\n🔍 Analyzing commits across {len(commit_indexes)} repositories...")
     
+    # Progress lines are buffered and printed once, rather than with a print call per line
+    progress = []
     for task in tasks:
-        print(f"\n📋 Task {task['id']}: {task['title'][:60]}...")
-        
-        if len(repo_paths) == 1:
-            repo = git.Repo(repo_paths[0])
-            commits = fetch_commits(repo, task['id'], start_date, end_date)
-            task['commits'] = commits
-            task['repo_sources'] = {repo_paths[0].split('/')[-1]: len(commits)} if commits else {}
-        else:
-            commits, repo_sources = fetch_commits_from_multiple_repos(repo_paths, task['id'], start_date, end_date)
-            task['commits'] = commits
-            task['repo_sources'] = repo_sources
+        progress.append(f"\n📋 Task {task['id']}: {task['title'][:60]}...")
         
+        commits, repo_sources = fetch_commits_from_multiple_repos(commit_indexes, task['id'], progress)
+        task['commits'] = commits
+        task['has_commits'] = bool(commits)
+        # Done means committed work or a closed Jira status; every report section reads this flag
+        task['is_done'] = task['has_commits'] or task['status_lower'] in DONE_STATUSES
+        task['repo_sources'] = repo_sources
         task['time'] = get_final_time_estimate(task, task['commits'])
+    
+    if progress:
+        print("\n".join(progress))
 
-def generate_report_content(args, tasks, business_analysis, start_date, end_date):
-    """Generate the appropriate report content based on arguments."""
+def generate_report_content(args, tasks, business_analysis, start_date, end_date, out=None):
+    """Generate the report content for the arguments, written to out or returned as a string when out is None."""
+    if out is None:
+        buffer = io.StringIO()
+        generate_report_content(args, tasks, business_analysis, start_date, end_date, buffer)
+        return buffer.getvalue()
+    
     if args.report_type == 'stakeholder':
-        return generate_stakeholder_report(tasks, business_analysis, start_date, end_date)
+        out.write(generate_stakeholder_report(tasks, business_analysis, start_date, end_date))
     elif args.report_type == 'technical':
         summary = generate_summary(tasks)
-        return build_report(tasks, summary)
+        build_report(tasks, summary, out)
     else:  # both
-        stakeholder_report = generate_stakeholder_report(tasks, business_analysis, start_date, end_date)
+        out.write(generate_stakeholder_report(tasks, business_analysis, start_date, end_date))
+        out.write("\n\n" + "="*80 + "\n\n" + "# TECHNICAL DETAILS REPORT\n\n")
         summary = generate_summary(tasks)
-        technical_report = build_report(tasks, summary)
-        return stakeholder_report + "\n\n" + "="*80 + "\n\n" + "# TECHNICAL DETAILS REPORT\n\n" + technical_report
+        build_report(tasks, summary, out)
 
 def output_report_summary(args, business_analysis, tasks):
     """Output a summary of the generated report to console."""
@@ -1550,25 +1946,41 @@ def output_report_summary(args, business_analysis, tasks):
     print(f"   • High priority items: {business_analysis['metrics']['high_priority_tasks']}")
     
     print("\n📁 REPOSITORY CONTRIBUTIONS:")
-    repo_totals = {}
+    repo_commits = Counter()
+    repo_task_counts = Counter()
     for task in tasks:
-        if task.get('repo_sources'):
-            for repo_name, commit_count in task['repo_sources'].items():
-                if repo_name not in repo_totals:
-                    repo_totals[repo_name] = {'commits': 0, 'tasks': 0}
-                repo_totals[repo_name]['commits'] += commit_count
-                repo_totals[repo_name]['tasks'] += 1
+        repo_sources = task['repo_sources']
+        if repo_sources:
+            repo_commits.update(repo_sources)
+            repo_task_counts.update(repo_sources.keys())
     
-    for repo_name, stats in repo_totals.items():
-        print(f"   • {repo_name}: {stats['commits']} commits across {stats['tasks']} tasks")
+    for repo_name, commit_count in repo_commits.items():
+        print(f"   • {repo_name}: {commit_count} commits across {repo_task_counts[repo_name]} tasks")
+
+def parse_date_argument(value):
+    """Validate a YYYY-MM-DD command-line date, returning it zero-padded."""
+    try:
+        return datetime.strptime(value, '%Y-%m-%d').strftime('%Y-%m-%d')
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid date '{value}', expected YYYY-MM-DD")
+
+def parse_repository_list(value):
+    """Split the comma-separated --repos value into stripped, non-empty paths."""
+    repo_paths = [path.strip() for path in value.split(',') if path.strip()]
+    if not repo_paths:
+        raise argparse.ArgumentTypeError("expected at least one repository path")
+    return repo_paths
 
 def create_argument_parser():
     """Create and configure the command-line argument parser"""
     parser = argparse.ArgumentParser(description="Generate a work report with AI summary.")
     parser.add_argument("--assignee", required=True, help="Jira assignee username")
-    parser.add_argument("--start-date", required=True, help="Start date (YYYY-MM-DD)")
-    parser.add_argument("--end-date", required=True, help="End date (YYYY-MM-DD)")
-    parser.add_argument("--repos", required=True, help="Comma-separated paths to Git repositories (e.g., '/path/repo1,/path/repo2,/path/repo3')")
+    parser.add_argument("--start-date", required=True, type=parse_date_argument, help="Start date (YYYY-MM-DD)")
+    parser.add_argument("--end-date", required=True, type=parse_date_argument, help="End date (YYYY-MM-DD)")
+    parser.add_argument("--repos", required=True, type=parse_repository_list, help="Comma-separated paths to Git repositories (e.g., '/path/repo1,/path/repo2,/path/repo3')")
+    parser.add_argument("--commit-author", help="Only count commits whose author name or email matches this pattern (passed to git log --author)")
+    parser.add_argument("--project-prefix", help="Jira project key (e.g., 'PROJ'); lets git log --grep select the matching commits")
+    parser.add_argument("--issue-keys", help="Comma-separated Jira issue keys to report on instead of searching by assignee and date (e.g., 'PROJ-1,PROJ-2')")
     parser.add_argument("--output", help="Output file path for the report (optional)")
     parser.add_argument("--report-type", 
                         choices=['technical', 'stakeholder', 'both'], 
@@ -1597,7 +2009,7 @@ def initialize_and_validate_repos(args):
 def process_all_formats(args, tasks, business_analysis, report, assignee_name):
     """Handle format 'all' - generate all formats"""
     print("🎨 Generating comprehensive report package...")
-    visualizer = ReportVisualizer()
+    visualizer = load_report_visualizer()()
     
     # Determine base filename
     if args.output:
@@ -1682,7 +2094,7 @@ def process_charts_only(visualizer, args, tasks, business_analysis, report):
 
 def process_single_format(args, tasks, business_analysis, report, assignee_name):
     """Handle single format generation (docx, pdf, or charts)"""
-    visualizer = ReportVisualizer()
+    visualizer = load_report_visualizer()()
     
     # Determine output filename
     output_file = determine_output_filename(args, assignee_name)
@@ -1697,7 +2109,7 @@ def process_single_format(args, tasks, business_analysis, report, assignee_name)
 
 def handle_advanced_formats(args, tasks, business_analysis, report, assignee_name):
     """Handle advanced formats (docx, pdf, charts)"""
-    if not VISUALIZER_AVAILABLE:
+    if load_report_visualizer() is None:
         print("⚠️ Advanced reporting features require additional dependencies.")
         print("   Install with: pip install -r requirements.txt")
         print("   Falling back to markdown format...")
@@ -1724,24 +2136,64 @@ def handle_standard_formats(args, report, business_analysis, tasks):
     else:
         print(report)
 
+def write_report_to_output(args, tasks, business_analysis):
+    """Stream a text/markdown report straight into the --output file, without building it in memory first"""
+    try:
+        with open(args.output, 'w') as f:
+            generate_report_content(args, tasks, business_analysis, args.start_date, args.end_date, f)
+        print(f"Report saved to {args.output}")
+        output_report_summary(args, business_analysis, tasks)
+    except IOError as e:
+        print(f"Error writing to file: {e}")
+
 def main():
     """Main function for generating work reports"""
     # Parse command-line arguments
     args = create_argument_parser().parse_args()
 
+    # Load environment variables from .env file
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    # Check for required environment variables
+    required_vars = ["JIRA_URL", "JIRA_USERNAME", "JIRA_API_TOKEN"]
+    missing_vars = [var for var in required_vars if not os.getenv(var)]
+    if missing_vars:
+        print(f"Error: Missing environment variables: {', '.join(missing_vars)}")
+        exit(1)
+
     # Initialize and validate repositories
     repo_paths = initialize_and_validate_repos(args)
     if not repo_paths:
         return
 
     # Initialize Jira client
-    jira = JIRA(server=os.getenv("JIRA_URL"), basic_auth=(os.getenv("JIRA_USERNAME"), os.getenv("JIRA_API_TOKEN")))
+    jira = create_jira_client()
 
-    # Fetch and process data
-    tasks = fetch_tasks(jira, args.assignee, args.start_date, args.end_date)
-    process_task_commits(tasks, repo_paths, args.start_date, args.end_date)
+    # Parse the commit window once; every walker compares raw commit timestamps against it
+    start_ts, end_ts = get_commit_time_window(args.start_date, args.end_date)
+    
+    # Fetch Jira issues while the repositories are walked; neither depends on the other
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        if args.issue_keys:
+            issue_keys = [key.strip() for key in args.issue_keys.split(',') if key.strip()]
+            tasks_future = executor.submit(fetch_tasks_by_keys, jira, issue_keys, args.assignee)
+        else:
+            tasks_future = executor.submit(fetch_tasks, jira, args.assignee, args.start_date, args.end_date)
+        indexes_future = executor.submit(build_commit_indexes, repo_paths, start_ts, end_ts,
+                                         args.commit_author, args.project_prefix)
+        tasks = tasks_future.result()
+        commit_indexes = indexes_future.result()
+    
+    # Process data
+    process_task_commits(tasks, commit_indexes)
     business_analysis = analyze_business_impact(tasks)
     
+    # A plain report saved to a file is written as it is generated; the other outputs need the whole text
+    if args.output and args.format in ['markdown', 'text'] and not args.charts:
+        write_report_to_output(args, tasks, business_analysis)
+        return
+    
     # Generate report content
     report = generate_report_content(args, tasks, business_analysis, args.start_date, args.end_date)
     assignee_name = get_assignee_name_from_tasks(tasks)
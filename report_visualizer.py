@@ -4,28 +4,56 @@ Generates charts and exports reports to DOCX/PDF formats
 """
 
 import os
+import importlib.util
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import plotly.io as pio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-import base64
+import hashlib
+import pathlib
+import urllib.parse
+import shutil
 from io import BytesIO
 import json
+import re
+import threading
 
-# Document generation imports
-from docx import Document
-from docx.shared import Inches, Pt
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.enum.style import WD_STYLE_TYPE
-from docx.oxml.shared import OxmlElement, qn
+# Charting (matplotlib, seaborn, plotly), DOCX (docx) and PDF (markdown2) libraries are imported where
+# they are used, so loading this module stays cheap; still fail here when one is missing so callers fall back
+LAZY_IMPORTED_MODULES = ('matplotlib', 'seaborn', 'plotly', 'docx', 'markdown2')
+missing_modules = [name for name in LAZY_IMPORTED_MODULES if importlib.util.find_spec(name) is None]
+if missing_modules:
+    raise ModuleNotFoundError(f"No module named '{missing_modules[0]}'", name=missing_modules[0])
 
-# PDF generation imports
-import markdown2
+CHART_CACHE_VERSION = 3  # Bump when chart styling or layout changes so cached PNGs are re-rendered
+CHART_CACHE_MAX_FILES = 50  # Cached PNGs kept, least recently used dropped first
+CHART_STAMP_FILE = ".stamp"  # In charts_dir: the cache key and chart files of the last complete run
+
+# Exported PNG size per chart, in layout pixels (written at 2x scale)
+CHART_EXPORT_SIZES = {
+    'business_impact': (1200, 500),
+    'velocity_trends': (1000, 600),
+    'priority_distribution': (800, 400),
+    'repository_activity': (1000, 400),
+    'performance_dashboard': (1200, 700)
+}
+MPL_EXPORT_DPI = 200  # Matplotlib PNGs at 1/100 inch per layout pixel, matching Plotly's 2x scale
+PNG_PALETTE_COLORS = 64  # Palette size for quantized chart PNGs; flat chart colors fit comfortably
+PNG_QUANTIZE_SKIP = ('performance_dashboard',)  # Charts kept in full color, the gauge bands blend smoothly
+CHART_TASK_FIELDS = ('time', 'priority', 'commits')  # Task fields the charts read from tasks_df
+REPOSITORY_TASK_FIELDS = ('repo_sources', 'repositories', 'commits', 'time')  # Task fields the repository chart reads
+# (section heading keyword, chart) pairs: the chart is placed under the first "## " section whose title contains the keyword
+DOCX_SECTION_CHARTS = (
+    ('business impact', 'business_impact'),
+    ('performance', 'performance_dashboard'),
+    ('velocity', 'velocity_trends')
+)
+MARKDOWN_LINE_RE = re.compile(r'(?P<heading>#{1,3}) |(?P<bullet>[•*]) |(?P<bold>\*\*)')  # Line prefixes the DOCX export styles
+DOCX_BLANK_LINE_SPACING = 6  # Points after the one empty paragraph that a run of blank markdown lines becomes
+DOCX_LINE_STYLES = ('Heading 1', 'Heading 2', 'Heading 3', 'List Bullet')  # Paragraph styles the markdown lines map to
+VELOCITY_SIMULATED_WEEKS = 4  # Weeks shown by the simulated velocity trends chart
+VELOCITY_SIMULATION_SEED = 42  # Fixed seed so the simulated weeks are the same on every run (and cache hit)
+CHART_RENDER_WORKERS = os.cpu_count() or 1  # Matplotlib charts drawn concurrently; Agg rasterizes outside the GIL
 
 class ReportVisualizer:
     """
@@ -35,29 +63,23 @@ class ReportVisualizer:
     def __init__(self, output_dir="reports"):
         self.output_dir = output_dir
         self.charts_dir = os.path.join(output_dir, "charts")
-        os.makedirs(self.charts_dir, exist_ok=True)
+        self.chart_cache_dir = os.path.join(self.charts_dir, "cache")
+        os.makedirs(self.chart_cache_dir, exist_ok=True)
+        self.rng = np.random.default_rng(VELOCITY_SIMULATION_SEED)
+        self.mpl_figure_pool = []  # Cleared matplotlib figures ready for the next chart
+        self.quantize_png = True  # Store chart PNGs as 8-bit palette images, several times smaller
+        self.markdown_converter = None  # markdown2.Markdown built on the first PDF report and reused after
+        self.mpl_ready = False  # Matplotlib and seaborn styling is applied before the first matplotlib chart
+        self.mpl_setup_lock = threading.Lock()
         
         # Set professional styling
         self.setup_styling()
         
     def setup_styling(self):
         """Set up professional styling for charts"""
-        # Matplotlib styling with fallbacks
-        try:
-            plt.style.use('seaborn-v0_8-darkgrid')
-        except OSError:
-            try:
-                plt.style.use('seaborn-darkgrid')
-            except OSError:
-                plt.style.use('default')
-                print("⚠️ Using default matplotlib style")
-        
-        try:
-            sns.set_palette("husl")
-        except Exception:
-            print("⚠️ Could not set seaborn palette")
+        import plotly.io as pio
         
-        # Plotly styling
+        # Plotly styling; matplotlib is styled on first use by _setup_mpl_once
         pio.templates.default = "plotly_white"
         
         # Color palettes
@@ -78,21 +100,43 @@ class ReportVisualizer:
             'Platform Stability': '#7209B7',
             'Feature Expansion': '#6C757D'
         }
+        
+        self.priority_colors = {
+            'High': self.colors['primary'],
+            'Medium': self.colors['accent']
+        }
+        
+        # Array form of business_colors; the extra last entry is the color for unknown categories
+        self.business_color_index = pd.Index(list(self.business_colors))
+        self.business_color_array = np.array(list(self.business_colors.values()) + ['#6C757D'], dtype=object)
+
+    def _task_frame(self, tasks, fields):
+        """Build a DataFrame of just the given task fields, one column per field that any task has"""
+        # Converting every task field (titles, dates, Jira metadata) would cost far more than the charts need
+        columns = {field: [task.get(field) for task in tasks] for field in fields
+                   if any(field in task for task in tasks)}
+        return pd.DataFrame(columns, index=pd.RangeIndex(len(tasks)))
 
     def prepare_data(self, tasks, business_analysis):
         """Prepare data for visualization"""
         
-        # Convert tasks to DataFrame for easier manipulation
-        df = pd.DataFrame(tasks)
+        # Convert the task fields the charts use to a DataFrame for easier manipulation
+        df = self._task_frame(tasks, CHART_TASK_FIELDS)
+        if 'priority' in df:
+            # Categories in order of first appearance, so value_counts breaks ties the way the plain column does
+            df['priority'] = pd.Categorical(df['priority'], categories=pd.unique(df['priority'].dropna()))
         
-        # Add business categories to tasks
-        for category_key, category_data in business_analysis['categories'].items():
-            for task in category_data['tasks']:
-                task['business_category'] = category_data['impact']
+        # Business category per DataFrame row, without writing into the task dicts
+        task_index = {id(task): i for i, task in enumerate(tasks)}
+        category_col = np.empty(len(tasks), dtype=object)
+        for category_data in business_analysis['categories'].values():
+            rows = [task_index[id(task)] for task in category_data['tasks'] if id(task) in task_index]
+            category_col[rows] = category_data['impact']
         
         # Create comprehensive dataset
         data = {
             'tasks_df': df,
+            'category_col': category_col,
             'business_analysis': business_analysis,
             'metrics': business_analysis['metrics'],
             'categories': business_analysis['categories']
@@ -100,27 +144,42 @@ class ReportVisualizer:
         
         return data
 
-    def create_business_impact_chart(self, data, save_path=None):
+    def _business_category_colors(self, categories):
+        """Look up the business color of each category with one indexer call"""
+        positions = self.business_color_index.get_indexer(categories)
+        positions[positions < 0] = len(self.business_color_array) - 1
+        return self.business_color_array.take(positions).tolist()
+
+    def create_business_impact_chart(self, data, save_path=None, backend='plotly'):
         """Create business impact distribution chart"""
         
-        categories = data['categories']
-        category_data = []
-        
-        for cat_key, cat_info in categories.items():
-            if cat_info['tasks']:
-                total_hours = sum(task.get('time', 0) for task in cat_info['tasks'])
-                completed_tasks = len([t for t in cat_info['tasks'] if t.get('commits')])
-                category_data.append({
-                    'Category': cat_info['impact'],
-                    'Hours': total_hours,
-                    'Tasks': len(cat_info['tasks']),
-                    'Completed': completed_tasks
-                })
-        
-        if not category_data:
+        tasks_df = data['tasks_df']
+        category_col = data['category_col']
+        categorized = pd.notna(category_col)
+        
+        if not categorized.any():
             return None
-            
-        df = pd.DataFrame(category_data)
+        
+        hours = tasks_df['time'].fillna(0) if 'time' in tasks_df else pd.Series(0, index=tasks_df.index)
+        completed = (tasks_df['commits'].map(lambda commits: isinstance(commits, (list, tuple)) and len(commits) > 0)
+                     if 'commits' in tasks_df else pd.Series(False, index=tasks_df.index))
+        category_stats = self._sum_by_key(
+            category_col[categorized],
+            Hours=hours.to_numpy()[categorized],
+            Completed=completed.to_numpy()[categorized]
+        ).rename(columns={'count': 'Tasks'})
+        category_stats['Completed'] = category_stats['Completed'].astype(np.int64)
+        
+        # Keep the category order of the business analysis
+        order = [cat_info['impact'] for cat_info in data['categories'].values() if cat_info['impact'] in category_stats.index]
+        df = category_stats.reindex(order).rename_axis('Category').reset_index()
+        colors = self._business_category_colors(df['Category'])
+        
+        if backend == 'mpl':
+            return self._draw_business_impact_mpl(df, colors, save_path)
+        
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
         
         # Create subplot with two charts
         fig = make_subplots(
@@ -135,7 +194,7 @@ class ReportVisualizer:
                 labels=df['Category'],
                 values=df['Hours'],
                 name="Hours",
-                marker_colors=[self.business_colors.get(cat, '#6C757D') for cat in df['Category']],
+                marker_colors=colors,
                 textinfo="label+percent",
                 textposition="inside"
             ),
@@ -159,7 +218,7 @@ class ReportVisualizer:
                 x=df['Category'],
                 y=df['Completed'],
                 name="Completed Tasks",
-                marker_color=[self.business_colors.get(cat, '#6C757D') for cat in df['Category']]
+                marker_color=colors
             ),
             row=1, col=2
         )
@@ -175,11 +234,12 @@ class ReportVisualizer:
         fig.update_xaxes(tickangle=45, row=1, col=2)
         
         if save_path:
-            fig.write_image(save_path, width=1200, height=500, scale=2)
+            width, height = CHART_EXPORT_SIZES['business_impact']
+            fig.write_image(save_path, width=width, height=height, scale=2)
         
         return fig
 
-    def create_velocity_trends_chart(self, data, save_path=None):
+    def create_velocity_trends_chart(self, data, save_path=None, backend='plotly'):
         """Create development velocity trends chart"""
         
         tasks_df = data['tasks_df']
@@ -188,20 +248,19 @@ class ReportVisualizer:
         
         # Group by week/sprint for velocity analysis
         # This is simulated data - in real implementation, you'd use actual dates
-        weeks = []
-        hours_per_week = []
-        tasks_per_week = []
-        
-        # Simulate 4 weeks of data based on total metrics
+        # Simulate weeks of data based on total metrics, drawing every week's variation at once
         total_hours = data['metrics']['total_time']
         total_tasks = data['metrics']['total_tasks']
         
-        for i in range(4):
-            week_hours = total_hours * self.rng.uniform(0.2, 0.3)  # Simulate weekly variation
-            week_tasks = total_tasks * self.rng.uniform(0.2, 0.3)
-            weeks.append(f"Week {i+1}")
-            hours_per_week.append(week_hours)
-            tasks_per_week.append(week_tasks)
+        weeks = [f"Week {i+1}" for i in range(VELOCITY_SIMULATED_WEEKS)]
+        hours_per_week = total_hours * self.rng.uniform(0.2, 0.3, size=VELOCITY_SIMULATED_WEEKS)
+        tasks_per_week = np.rint(total_tasks * self.rng.uniform(0.2, 0.3, size=VELOCITY_SIMULATED_WEEKS)).astype(int)
+        
+        if backend == 'mpl':
+            return self._draw_velocity_trends_mpl(weeks, hours_per_week, tasks_per_week, save_path)
+        
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
         
         fig = make_subplots(
             rows=2, cols=1,
@@ -243,11 +302,12 @@ class ReportVisualizer:
         )
         
         if save_path:
-            fig.write_image(save_path, width=1000, height=600, scale=2)
+            width, height = CHART_EXPORT_SIZES['velocity_trends']
+            fig.write_image(save_path, width=width, height=height, scale=2)
         
         return fig
 
-    def create_priority_distribution_chart(self, data, save_path=None):
+    def create_priority_distribution_chart(self, data, save_path=None, backend='plotly'):
         """Create task priority distribution chart"""
         
         tasks_df = data['tasks_df']
@@ -256,17 +316,19 @@ class ReportVisualizer:
         
         # Count tasks by priority
         priority_counts = tasks_df['priority'].value_counts()
+        priorities = priority_counts.index.astype(object)
+        colors = priorities.map(self.priority_colors).fillna(self.colors['neutral']).tolist()
+        
+        if backend == 'mpl':
+            return self._draw_priority_distribution_mpl(priorities, priority_counts.values, colors, save_path)
+        
+        import plotly.graph_objects as go
         
         fig = go.Figure(data=[
             go.Bar(
-                x=priority_counts.index,
+                x=priorities,
                 y=priority_counts.values,
-                marker_color=[
-                    self.colors['primary'] if p == 'High' 
-                    else self.colors['accent'] if p == 'Medium'
-                    else self.colors['neutral']
-                    for p in priority_counts.index
-                ],
+                marker_color=colors,
                 text=priority_counts.values,
                 textposition='auto'
             )
@@ -281,32 +343,63 @@ class ReportVisualizer:
         )
         
         if save_path:
-            fig.write_image(save_path, width=800, height=400, scale=2)
+            width, height = CHART_EXPORT_SIZES['priority_distribution']
+            fig.write_image(save_path, width=width, height=height, scale=2)
         
         return fig
 
-    def create_repository_activity_chart(self, tasks, save_path=None):
+    def _aggregate_repository_activity(self, tasks):
+        """Sum commits, hours and tasks per repository, in order of first appearance"""
+        df = self._task_frame(tasks, REPOSITORY_TASK_FIELDS)
+        if df.empty:
+            return None
+        hours = df['time'].fillna(0) if 'time' in df else 0
+        
+        if 'repo_sources' in df:
+            # Tasks from main.py carry {repository: commit count} for the commits found in each repository
+            pairs = df['repo_sources'].map(lambda sources: list(sources.items()) if isinstance(sources, dict) else [])
+            rows = pd.DataFrame({'pair': pairs, 'hours': hours}).explode('pair').dropna(subset=['pair'])
+            if rows.empty:
+                return None
+            rows['repository'] = rows['pair'].str[0]
+            rows['commits'] = rows['pair'].str[1]
+        elif 'repositories' in df:
+            # Tasks listing repositories count all of their commits towards each one
+            commit_counts = df['commits'].map(lambda commits: len(commits) if isinstance(commits, (list, tuple)) else 0) if 'commits' in df else 0
+            rows = pd.DataFrame({'repository': df['repositories'], 'commits': commit_counts, 'hours': hours})
+            rows = rows.explode('repository').dropna(subset=['repository'])
+        else:
+            return None
+        
+        repo_stats = self._sum_by_key(rows['repository'], commits=rows['commits'], hours=rows['hours'])
+        repo_stats['commits'] = repo_stats['commits'].round().astype(np.int64)
+        return repo_stats.rename(columns={'count': 'tasks'}).rename_axis('repository')
+
+    def _sum_by_key(self, keys, **columns):
+        """Sum columns per distinct key through integer codes and np.bincount, in order of first appearance"""
+        codes, uniques = pd.factorize(np.asarray(keys, dtype=object))
+        sums = {name: np.bincount(codes, weights=np.asarray(values, dtype=np.float64), minlength=len(uniques))
+                for name, values in columns.items()}
+        sums['count'] = np.bincount(codes, minlength=len(uniques))
+        return pd.DataFrame(sums, index=uniques)
+
+    def create_repository_activity_chart(self, tasks, save_path=None, backend='plotly'):
         """Create repository activity chart"""
         
-        # Extract repository data from tasks
-        repo_data = {}
-        for task in tasks:
-            repos = task.get('repositories', [])
-            commits = task.get('commits', [])
-            
-            for repo in repos:
-                if repo not in repo_data:
-                    repo_data[repo] = {'commits': 0, 'hours': 0, 'tasks': 0}
-                repo_data[repo]['commits'] += len(commits)
-                repo_data[repo]['hours'] += task.get('time', 0)
-                repo_data[repo]['tasks'] += 1
-        
-        if not repo_data:
+        # Aggregate repository data with one exploded frame instead of per-task dict updates
+        repo_stats = self._aggregate_repository_activity(tasks)
+        if repo_stats is None or repo_stats.empty:
             return None
         
-        repos = list(repo_data.keys())
-        commits = [repo_data[repo]['commits'] for repo in repos]
-        hours = [repo_data[repo]['hours'] for repo in repos]
+        repos = repo_stats.index
+        commits = repo_stats['commits']
+        hours = repo_stats['hours']
+        
+        if backend == 'mpl':
+            return self._draw_repository_activity_mpl(repos, commits, hours, save_path)
+        
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
         
         fig = make_subplots(
             rows=1, cols=2,
@@ -343,15 +436,22 @@ class ReportVisualizer:
         )
         
         if save_path:
-            fig.write_image(save_path, width=1000, height=400, scale=2)
+            width, height = CHART_EXPORT_SIZES['repository_activity']
+            fig.write_image(save_path, width=width, height=height, scale=2)
         
         return fig
 
-    def create_performance_dashboard(self, data, save_path=None):
+    def create_performance_dashboard(self, data, save_path=None, backend='plotly'):
         """Create comprehensive performance dashboard"""
         
         metrics = data['metrics']
         
+        if backend == 'mpl':
+            return self._draw_performance_dashboard_mpl(metrics, save_path)
+        
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
+        
         fig = make_subplots(
             rows=2, cols=2,
             specs=[[{"type": "indicator"}, {"type": "indicator"}],
@@ -430,89 +530,405 @@ class ReportVisualizer:
         )
         
         if save_path:
-            fig.write_image(save_path, width=1200, height=700, scale=2)
+            width, height = CHART_EXPORT_SIZES['performance_dashboard']
+            fig.write_image(save_path, width=width, height=height, scale=2)
         
         return fig
 
-    def generate_all_charts(self, tasks, business_analysis):
-        """Generate all charts for the report"""
+    def _setup_mpl_once(self):
+        """Load and style matplotlib and seaborn the first time a chart is drawn with matplotlib"""
+        with self.mpl_setup_lock:
+            if self.mpl_ready:
+                return
+            import matplotlib
+            matplotlib.use('Agg')  # Charts are only written to files, never shown
+            import matplotlib.pyplot as plt
+            import seaborn as sns
+            
+            # Matplotlib styling with fallbacks
+            try:
+                plt.style.use('seaborn-v0_8-darkgrid')
+            except OSError:
+                try:
+                    plt.style.use('seaborn-darkgrid')
+                except OSError:
+                    plt.style.use('default')
+                    print("⚠️ Using default matplotlib style")
+            
+            try:
+                sns.set_palette("husl")
+            except Exception:
+                print("⚠️ Could not set seaborn palette")
+            
+            self.mpl_ready = True
+
+    def _mpl_subplots(self, chart_name, nrows=1, ncols=1, **kwargs):
+        """Borrow a pooled matplotlib figure sized like the Plotly export of the same chart"""
+        self._setup_mpl_once()
+        # A standalone Figure stays out of pyplot's global registry, so charts can be drawn from several threads;
+        # list.pop is atomic, so each worker gets a figure of its own
+        width, height = CHART_EXPORT_SIZES[chart_name]
+        try:
+            fig = self.mpl_figure_pool.pop()
+        except IndexError:
+            from matplotlib.figure import Figure
+            fig = Figure()
+        
+        fig.set_size_inches(width / 100, height / 100)
+        return fig, fig.subplots(nrows, ncols, **kwargs)
+
+    def _save_mpl_figure(self, fig, save_path):
+        """Write a matplotlib figure to PNG with the Agg renderer and return it cleared to the pool"""
+        try:
+            fig.tight_layout()
+            if save_path:
+                fig.savefig(save_path, dpi=MPL_EXPORT_DPI)
+        finally:
+            fig.clear()
+            self.mpl_figure_pool.append(fig)
+        return save_path
+
+    def _draw_business_impact_mpl(self, df, colors, save_path):
+        """Draw the business impact chart with matplotlib"""
+        fig, (pie_ax, bar_ax) = self._mpl_subplots('business_impact', 1, 2)
+        
+        if df['Hours'].sum() > 0:
+            pie_ax.pie(df['Hours'], labels=df['Category'], colors=colors, autopct='%1.1f%%',
+                       textprops={'fontsize': 8})
+        pie_ax.set_title('Time Investment by Category')
+        
+        positions = np.arange(len(df))
+        bar_ax.bar(positions - 0.2, df['Tasks'], 0.4, label='Total Tasks', color='lightblue', alpha=0.7)
+        bar_ax.bar(positions + 0.2, df['Completed'], 0.4, label='Completed Tasks', color=colors)
+        bar_ax.set_xticks(positions, df['Category'], rotation=45, ha='right')
+        bar_ax.set_title('Task Completion by Category')
+        bar_ax.legend()
+        
+        fig.suptitle('Business Impact Analysis')
+        return self._save_mpl_figure(fig, save_path)
+
+    def _draw_velocity_trends_mpl(self, weeks, hours_per_week, tasks_per_week, save_path):
+        """Draw the velocity trends chart with matplotlib"""
+        fig, (hours_ax, tasks_ax) = self._mpl_subplots('velocity_trends', 2, 1)
+        
+        hours_ax.plot(weeks, hours_per_week, marker='o', markersize=8, linewidth=3, color=self.colors['primary'])
+        hours_ax.set_title('Development Hours per Week')
+        tasks_ax.plot(weeks, tasks_per_week, marker='o', markersize=8, linewidth=3, color=self.colors['accent'])
+        tasks_ax.set_title('Tasks Completed per Week')
         
+        fig.suptitle('Development Velocity Trends')
+        return self._save_mpl_figure(fig, save_path)
+
+    def _draw_priority_distribution_mpl(self, priorities, counts, colors, save_path):
+        """Draw the priority distribution chart with matplotlib"""
+        fig, ax = self._mpl_subplots('priority_distribution')
+        
+        bars = ax.bar([str(p) for p in priorities], counts, color=colors)
+        ax.bar_label(bars)
+        ax.set_xlabel('Priority Level')
+        ax.set_ylabel('Number of Tasks')
+        ax.set_title('Task Priority Distribution')
+        return self._save_mpl_figure(fig, save_path)
+
+    def _draw_repository_activity_mpl(self, repos, commits, hours, save_path):
+        """Draw the repository activity chart with matplotlib"""
+        fig, (commits_ax, hours_ax) = self._mpl_subplots('repository_activity', 1, 2)
+        labels = [str(repo) for repo in repos]
+        
+        commits_ax.bar(labels, commits, color=self.colors['primary'])
+        commits_ax.set_title('Commits per Repository')
+        hours_ax.bar(labels, hours, color=self.colors['accent'])
+        hours_ax.set_title('Hours per Repository')
+        for ax in (commits_ax, hours_ax):
+            ax.tick_params(axis='x', labelrotation=30)
+        
+        fig.suptitle('Repository Activity Analysis')
+        return self._save_mpl_figure(fig, save_path)
+
+    def _draw_performance_dashboard_mpl(self, metrics, save_path):
+        """Draw the performance dashboard with matplotlib"""
+        fig, ((gauge_ax, hours_ax), (progress_ax, status_ax)) = self._mpl_subplots('performance_dashboard', 2, 2)
+        
+        # Completion rate as a banded horizontal gauge
+        for (low, high), color in zip(((0, 50), (50, 80), (80, 100)), ('lightgray', 'yellow', 'green')):
+            gauge_ax.barh(0, high - low, left=low, height=0.6, color=color)
+        gauge_ax.barh(0, metrics['completion_rate'], height=0.25, color=self.colors['primary'])
+        gauge_ax.axvline(90, ymin=0.2, ymax=0.8, color='red', linewidth=4)
+        gauge_ax.set_xlim(0, 100)
+        gauge_ax.set_yticks([])
+        gauge_ax.set_title(f"Completion Rate (%): {metrics['completion_rate']:.1f}")
+        
+        # Total hours with the same relative delta the Plotly indicator shows
+        reference = metrics['total_time'] * 0.8
+        hours_ax.axis('off')
+        hours_ax.set_title('Total Hours')
+        hours_ax.text(0.5, 0.55, f"{metrics['total_time']:.1f}h", ha='center', va='center', fontsize=28)
+        if reference:
+            delta = (metrics['total_time'] - reference) / abs(reference)
+            hours_ax.text(0.5, 0.25, f"{'▲' if delta >= 0 else '▼'}{abs(delta):.1%}", ha='center', va='center',
+                          fontsize=14, color='green' if delta >= 0 else 'red')
+        
+        # Simulated weekly progress
+        weeks = ['Week 1', 'Week 2', 'Week 3', 'Week 4']
+        progress_ax.plot(weeks, [25, 30, 35, 30], label='Planned', color='blue', linestyle='--')
+        progress_ax.plot(weeks, [28, 27, 38, 32], label='Actual', color='green')
+        progress_ax.set_title('Weekly Progress')
+        progress_ax.legend()
+        
+        status_values = [metrics['completed_tasks'], metrics['total_tasks'] - metrics['completed_tasks']]
+        if sum(status_values) > 0:
+            status_ax.pie(status_values, labels=['Completed', 'In Progress'], autopct='%1.1f%%')
+        status_ax.set_title('Task Status Distribution')
+        
+        fig.suptitle('Performance Dashboard')
+        return self._save_mpl_figure(fig, save_path)
+
+    def _chart_cache_key(self, tasks, business_analysis, backend='plotly'):
+        """Hash the chart inputs so unchanged data reuses the PNGs rendered last time"""
+        chart_inputs = {
+            'version': CHART_CACHE_VERSION,
+            'backend': backend,
+            'quantize_png': self.quantize_png,
+            'tasks': tasks,
+            'metrics': business_analysis['metrics'],
+            'categories': {key: [task.get('id', task.get('title')) for task in category['tasks']]
+                           for key, category in business_analysis['categories'].items()}
+        }
+        blob = json.dumps(chart_inputs, sort_keys=True, default=str).encode('utf-8')
+        return hashlib.sha256(blob).hexdigest()[:16]
+
+    def generate_all_charts(self, tasks, business_analysis, backend='mpl'):
+        """Generate all charts for the report, drawn with matplotlib ('mpl') or Plotly and Kaleido ('plotly')"""
+        
+        # Identical inputs reuse the PNGs rendered last time
+        cache_key = self._chart_cache_key(tasks, business_analysis, backend)
+        chart_files = self._read_chart_stamp(cache_key)
+        if chart_files is not None:
+            print(f"📦 Charts are up to date ({len(chart_files)} reused)")
+            return chart_files
+        
+        # This run rewrites the PNGs in charts_dir, so an older stamp must not outlive it if the run is incomplete
+        self._clear_chart_stamp()
         data = self.prepare_data(tasks, business_analysis)
         chart_files = {}
+        complete = True
+        if backend == 'mpl':
+            self._setup_mpl_once()  # Style once here rather than racing in the chart workers
         
         # Generate each chart
         charts = {
             'business_impact': self.create_business_impact_chart,
             'velocity_trends': self.create_velocity_trends_chart,
             'priority_distribution': self.create_priority_distribution_chart,
-            'repository_activity': lambda d, p: self.create_repository_activity_chart(tasks, p),
+            'repository_activity': lambda d, p, b: self.create_repository_activity_chart(tasks, p, b),
             'performance_dashboard': self.create_performance_dashboard
         }
         
-        for chart_name, chart_func in charts.items():
-            file_path = os.path.join(self.charts_dir, f"{chart_name}.png")
+        # Matplotlib charts are drawn and written concurrently; Plotly figures are built first and exported together in one Kaleido session
+        pending = []
+        rendering = []
+        with ThreadPoolExecutor(max_workers=max(1, min(CHART_RENDER_WORKERS, len(charts)))) as executor:
+            for chart_name, chart_func in charts.items():
+                file_path = os.path.join(self.charts_dir, f"{chart_name}.png")
+                cache_path = os.path.join(self.chart_cache_dir, f"{cache_key}_{chart_name}.png")
+                try:
+                    if os.path.exists(cache_path):
+                        shutil.copyfile(cache_path, file_path)
+                        os.utime(cache_path)  # Mark as recently used for pruning
+                        chart_files[chart_name] = file_path
+                        print(f"📦 Reused cached {chart_name} chart")
+                        continue
+                    
+                    if backend == 'mpl':
+                        rendering.append((chart_name, file_path, cache_path,
+                                          executor.submit(self._render_chart_png, chart_name, chart_func, data, file_path)))
+                        continue
+                    
+                    fig = chart_func(data, None, backend)
+                    if fig:
+                        pending.append((chart_name, fig, file_path, cache_path))
+                except Exception as e:
+                    complete = False
+                    print(f"⚠️ Error generating {chart_name}: {e}")
+        
+        for chart_name, file_path, cache_path, future in rendering:
             try:
-                fig = chart_func(data, file_path)
-                if fig:
+                if future.result():
                     chart_files[chart_name] = file_path
+                    shutil.copyfile(file_path, cache_path)
                     print(f"✅ Generated {chart_name} chart")
             except Exception as e:
+                complete = False
                 print(f"⚠️ Error generating {chart_name}: {e}")
         
+        exported = self._export_chart_images(pending)
+        complete = complete and len(exported) == len(pending)
+        for chart_name, fig, file_path, cache_path in exported:
+            self._quantize_chart_png(chart_name, file_path)
+            chart_files[chart_name] = file_path
+            shutil.copyfile(file_path, cache_path)
+            print(f"✅ Generated {chart_name} chart")
+        
+        # Failed charts are retried next time, so only a complete run is stamped
+        if complete:
+            self._write_chart_stamp(cache_key, chart_files)
+        self._prune_chart_cache()
+        return chart_files
+
+    def _render_chart_png(self, chart_name, chart_func, data, file_path):
+        """Draw one chart to file_path with matplotlib, returning the path or None when there was nothing to draw"""
+        if not chart_func(data, file_path, 'mpl'):
+            return None
+        self._quantize_chart_png(chart_name, file_path)
+        return file_path
+
+    def _quantize_chart_png(self, chart_name, file_path):
+        """Rewrite a chart PNG as an 8-bit palette image when quantize_png is on"""
+        if not self.quantize_png or chart_name in PNG_QUANTIZE_SKIP:
+            return
+        try:
+            from PIL import Image
+        except ImportError:
+            return
+        
+        try:
+            with Image.open(file_path) as image:
+                palette_image = image.convert('RGB').quantize(colors=PNG_PALETTE_COLORS, method=Image.Quantize.FASTOCTREE)
+            palette_image.save(file_path, optimize=True)
+        except OSError as e:
+            print(f"⚠️ Keeping full-color {chart_name} chart: {e}")
+
+    def _read_chart_stamp(self, cache_key):
+        """Return the chart files of the last complete run if it had the same inputs and its PNGs are still there"""
+        try:
+            with open(os.path.join(self.charts_dir, CHART_STAMP_FILE), encoding='utf-8') as f:
+                stamp = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        chart_files = stamp.get('charts', {})
+        if stamp.get('key') != cache_key or not all(os.path.exists(path) for path in chart_files.values()):
+            return None
         return chart_files
 
-    def _process_markdown_line(self, doc, line, current_section):
+    def _clear_chart_stamp(self):
+        """Remove the stamp before charts_dir is rewritten, so it never describes files from another run"""
+        try:
+            os.remove(os.path.join(self.charts_dir, CHART_STAMP_FILE))
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"⚠️ Could not remove chart stamp: {e}")
+
+    def _write_chart_stamp(self, cache_key, chart_files):
+        """Record the cache key and chart files of a complete run"""
+        try:
+            with open(os.path.join(self.charts_dir, CHART_STAMP_FILE), 'w', encoding='utf-8') as f:
+                json.dump({'key': cache_key, 'charts': chart_files}, f)
+        except OSError as e:
+            print(f"⚠️ Could not write chart stamp: {e}")
+
+    def _export_chart_images(self, pending):
+        """Write the (name, figure, path, cache path) charts to PNG, returning the ones that succeeded"""
+        if not pending:
+            return []
+        import plotly.io as pio
+        
+        sizes = [CHART_EXPORT_SIZES[chart_name] for chart_name, _, _, _ in pending]
+        # write_images needs Kaleido 1.0+, which starts the browser once for the whole batch
+        if hasattr(pio, 'write_images'):
+            try:
+                pio.write_images(
+                    [fig for _, fig, _, _ in pending],
+                    [file_path for _, _, file_path, _ in pending],
+                    width=[width for width, _ in sizes],
+                    height=[height for _, height in sizes],
+                    scale=2
+                )
+                return pending
+            except Exception as e:
+                print(f"⚠️ Batch chart export failed, exporting charts one by one: {e}")
+        
+        exported = []
+        for chart, (width, height) in zip(pending, sizes):
+            chart_name, fig, file_path, _ = chart
+            try:
+                fig.write_image(file_path, width=width, height=height, scale=2)
+                exported.append(chart)
+            except Exception as e:
+                print(f"⚠️ Error generating {chart_name}: {e}")
+        return exported
+
+    def _prune_chart_cache(self):
+        """Drop the least recently used cached PNGs beyond CHART_CACHE_MAX_FILES"""
+        try:
+            cached = [os.path.join(self.chart_cache_dir, name) for name in os.listdir(self.chart_cache_dir)]
+            cached.sort(key=os.path.getmtime, reverse=True)
+            for stale_path in cached[CHART_CACHE_MAX_FILES:]:
+                os.remove(stale_path)
+        except OSError as e:
+            print(f"⚠️ Could not prune chart cache: {e}")
+
+    def _append_docx_paragraph(self, doc, text, style_id=None, bold=False):
+        """Append a <w:p> straight to the document body, skipping python-docx's per-call style lookup"""
+        from docx.oxml.shared import OxmlElement
+        
+        p = doc.element.body.add_p()  # Inserted before the trailing sectPr, like doc.add_paragraph
+        if style_id:
+            p.get_or_add_pPr().style = style_id
+        if text or bold:
+            run = p.add_r()
+            if bold:
+                run.get_or_add_rPr().append(OxmlElement('w:b'))
+            if text:
+                run.text = text
+        return p
+
+    def _process_markdown_line(self, doc, line, current_section, style_ids):
         """Process a single markdown line and add appropriate content to document"""
         line = line.strip()
         if not line:
-            doc.add_paragraph("")
+            from docx.shared import Pt
+            
+            self._append_docx_paragraph(doc, "").get_or_add_pPr().spacing_after = Pt(DOCX_BLANK_LINE_SPACING)
             return current_section
             
-        if line.startswith('# '):
-            doc.add_heading(line[2:], level=1)
-        elif line.startswith('## '):
-            doc.add_heading(line[3:], level=2)
-            current_section = line[3:].lower()
-        elif line.startswith('### '):
-            doc.add_heading(line[4:], level=3)
-        elif line.startswith('• ') or line.startswith('* '):
-            doc.add_paragraph(line[2:], style='List Bullet')
-        elif line.startswith('**') and line.endswith('**'):
-            p = doc.add_paragraph()
-            run = p.add_run(line[2:-2])
-            run.bold = True
+        # One anchored match picks the line type instead of trying each prefix in turn
+        match = MARKDOWN_LINE_RE.match(line)
+        kind = match.lastgroup if match else None
+        
+        if kind == 'heading':
+            level = len(match.group('heading'))
+            self._append_docx_paragraph(doc, line[match.end():], style_ids[f'Heading {level}'])
+            if level == 2:
+                current_section = line[match.end():].lower()
+        elif kind == 'bullet':
+            self._append_docx_paragraph(doc, line[2:], style_ids['List Bullet'])
+        elif kind == 'bold' and line.endswith('**'):
+            self._append_docx_paragraph(doc, line[2:-2], bold=True)
         else:
-            if line:
-                doc.add_paragraph(line)
+            self._append_docx_paragraph(doc, line)
         
         return current_section
 
     def _insert_chart_if_appropriate(self, doc, current_section, chart_files):
-        """Insert chart if the current section matches chart type"""
+        """Insert the charts whose section keyword appears in a newly started section"""
+        from docx.shared import Inches
+        
         chart_inserted = False
         
-        if "business impact" in current_section and 'business_impact' in chart_files:
-            doc.add_paragraph("")
-            doc.add_picture(chart_files['business_impact'], width=Inches(6))
-            chart_files.pop('business_impact')
-            chart_inserted = True
-            
-        elif "performance" in current_section and 'performance_dashboard' in chart_files:
-            doc.add_paragraph("")
-            doc.add_picture(chart_files['performance_dashboard'], width=Inches(6))
-            chart_files.pop('performance_dashboard')
-            chart_inserted = True
-            
-        elif "velocity" in current_section and 'velocity_trends' in chart_files:
-            doc.add_paragraph("")
-            doc.add_picture(chart_files['velocity_trends'], width=Inches(6))
-            chart_files.pop('velocity_trends')
-            chart_inserted = True
+        for keyword, chart_name in DOCX_SECTION_CHARTS:
+            if keyword in current_section and chart_name in chart_files:
+                doc.add_paragraph("")
+                doc.add_picture(chart_files.pop(chart_name), width=Inches(6))
+                chart_inserted = True
         
         return chart_inserted
 
     def _add_remaining_charts(self, doc, chart_files):
         """Add any remaining charts at the end of the document"""
+        from docx.shared import Inches
+        
         if chart_files:
             doc.add_heading('Additional Charts', level=2)
             for chart_name, chart_path in chart_files.items():
@@ -521,6 +937,8 @@ class ReportVisualizer:
 
     def create_docx_report(self, report_content, chart_files, output_file="professional_report.docx"):
         """Create DOCX report with embedded charts"""
+        from docx import Document
+        from docx.enum.text import WD_ALIGN_PARAGRAPH
         
         doc = Document()
         
@@ -532,13 +950,23 @@ class ReportVisualizer:
         doc.add_paragraph(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         doc.add_paragraph("") # Empty line
         
-        # Parse markdown content and add to document
-        lines = report_content.split('\n')
+        # Parse markdown content and add to document, resolving each paragraph style once
+        style_ids = {name: doc.styles[name].style_id for name in DOCX_LINE_STYLES}
         current_section = ""
-        
-        for line in lines:
-            current_section = self._process_markdown_line(doc, line, current_section)
-            self._insert_chart_if_appropriate(doc, current_section, chart_files)
+        previous_blank = False
+        
+        for line in report_content.splitlines():
+            # A run of blank lines becomes a single spaced paragraph
+            blank = not line.strip()
+            if blank and previous_blank:
+                continue
+            previous_blank = blank
+            
+            # Charts only need placing when a "## " heading starts a new section
+            section = self._process_markdown_line(doc, line, current_section, style_ids)
+            if section != current_section:
+                current_section = section
+                self._insert_chart_if_appropriate(doc, current_section, chart_files)
         
         # Add any remaining charts at the end
         self._add_remaining_charts(doc, chart_files)
@@ -550,11 +978,23 @@ class ReportVisualizer:
         
         return doc_path
 
+    def _chart_image_src(self, chart_path):
+        """URL of a chart PNG relative to the output directory, where both the PDF and the HTML fallback resolve it"""
+        try:
+            relative_path = os.path.relpath(chart_path, self.output_dir)
+        except ValueError:  # On another drive, so there is no relative path
+            relative_path = os.pardir
+        if relative_path == os.pardir or relative_path.startswith(os.pardir + os.sep):
+            return pathlib.Path(chart_path).resolve().as_uri()
+        return urllib.parse.quote(pathlib.Path(relative_path).as_posix())
+
     def create_pdf_report(self, report_content, chart_files, output_file="professional_report.pdf"):
         """Create PDF report with embedded charts"""
-        
-        # Convert markdown to HTML
-        html_content = markdown2.markdown(report_content, extras=['fenced-code-blocks', 'tables'])
+        # Convert markdown to HTML; convert() resets the converter's state itself, so one instance serves every report
+        if self.markdown_converter is None:
+            import markdown2
+            self.markdown_converter = markdown2.Markdown(extras=['fenced-code-blocks', 'tables'])
+        html_content = self.markdown_converter.convert(report_content)
         
         # Add CSS styling
         css_style = """
@@ -590,18 +1030,17 @@ class ReportVisualizer:
         </style>
         """
         
-        # Embed charts as base64 images
-        chart_html = ""
+        # Link charts by file instead of inlining them as base64
+        chart_parts = []
         for chart_name, chart_path in chart_files.items():
             if os.path.exists(chart_path):
-                with open(chart_path, 'rb') as f:
-                    img_data = base64.b64encode(f.read()).decode()
-                chart_html += f"""
+                chart_parts.append(f"""
                 <div class="chart">
                     <h3>{chart_name.replace('_', ' ').title()}</h3>
-                    <img src="data:image/png;base64,{img_data}" style="max-width: 100%; height: auto;">
+                    <img src="{self._chart_image_src(chart_path)}" style="max-width: 100%; height: auto;">
                 </div>
-                """
+                """)
+        chart_html = "".join(chart_parts)
         
         # Combine everything
         full_html = f"""
@@ -623,7 +1062,7 @@ class ReportVisualizer:
         try:
             import weasyprint
             pdf_path = os.path.join(self.output_dir, output_file)
-            weasyprint.HTML(string=full_html).write_pdf(pdf_path)
+            weasyprint.HTML(string=full_html, base_url=self.output_dir).write_pdf(pdf_path)
             print(f"✅ PDF report saved to: {pdf_path}")
             return pdf_path
         except ImportError:
@@ -634,8 +1073,7 @@ class ReportVisualizer:
         
         # Fallback: save HTML file
         html_path = os.path.join(self.output_dir, output_file.replace('.pdf', '.html'))
-        with open(html_path, 'w', encoding='utf-8') as f:
-            f.write(full_html)
+        pathlib.Path(html_path).write_bytes(full_html.encode('utf-8'))  # One encode and write, no TextIOWrapper chunking
         print(f"✅ HTML report saved to: {html_path}")
         return html_path
 